@@ -64,6 +64,14 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []  # (add "first_name", "last_name", "role" if you want them required for createsuperuser)
 
+    class Meta:
+        # role-scoped listings (bank/admin SPO tables): filter + id ordering/keyset
+        indexes = [
+            models.Index(fields=["role", "-id"]),
+            models.Index(fields=["role", "is_active", "-id"]),
+            models.Index(fields=["role", "date_joined"]),
+        ]
+
     def __str__(self):
         return f"{self.email} ({self.role})"
 
@@ -164,4 +164,39 @@ def test_duplicate_and_reorder():
     listing = client.get(f"/api/admin/questions/by-section/?section={sec_obj['code']}").json()
     orders = [{"id": x["id"], "order": i + 1} for i, x in enumerate(reversed(listing))]
     re = client.post("/api/admin/questions/reorder/", {"orders": orders}, format="json")
-    assert re.status_code == 200 and re.json()["updated"] == len(orders)
\ No newline at end of file
+    assert re.status_code == 200 and re.json()["updated"] == len(orders)
+
+
+@pytest.mark.django_db
+def test_add_sector_suffixes_taken_codes():
+    client = _login_admin()
+    impact, _ = Section.objects.get_or_create(code="IMPACT", defaults={"title": "Impact", "order": 1})
+    Question.objects.create(section=impact, code="Q1", text="Template", type="RATING", sector="TPL")
+    # both the base code and the first suffix are already taken
+    Question.objects.create(section=impact, code="Q1_AGRI", text="x", type="RATING", sector="X")
+    Question.objects.create(section=impact, code="Q1_AGRI_1", text="x", type="RATING", sector="X")
+
+    r = client.post("/api/admin/questions/add-sector/", {"sector": "Agri", "template_sector": "TPL"}, format="json")
+    assert r.status_code == 201, r.content
+    assert r.json()["created_questions"] == 1
+    assert Question.objects.get(section=impact, sector="Agri").code == "Q1_AGRI_2"
+
+
+@pytest.mark.django_db
+def test_edit_sector_refreshes_cached_sectors(django_capture_on_commit_callbacks):
+    from organizations.cache import focus_sectors
+
+    client = _login_admin()
+    impact, _ = Section.objects.get_or_create(code="IMPACT", defaults={"title": "Impact", "order": 1})
+    Question.objects.create(section=impact, code="Q_OLD", text="x", type="RATING", sector="OldSector")
+    assert {"label": "OldSector", "value": "OldSector"} in focus_sectors()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        r = client.post(
+            "/api/admin/questions/edit-sector/",
+            {"old_sector": "OldSector", "new_sector": "NewSector"},
+            format="json",
+        )
+    assert r.status_code == 200, r.content
+    values = [s["value"] for s in focus_sectors()]
+    assert "NewSector" in values and "OldSector" not in values
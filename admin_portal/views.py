@@ -2,7 +2,7 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
 from django.db.models import Max
@@ -11,6 +11,9 @@ from admin_portal.permissions import IsAdminRole
 from admin_portal.serializers import SectionAdminSerializer, QuestionAdminSerializer
 from questionnaires.models import Section, Question, AnswerOption, BranchingCondition, QuestionDimension
 from organizations.models import Organization
+from banks.cache import invalidate_spo_list
+from organizations.cache import invalidate_focus_sectors
+from questionnaires.cache import invalidate_control_qcodes, invalidate_section_rules
 from django.db import transaction
 from django.db.models import Max, Count, Q
 from django.utils.text import slugify
@@ -94,6 +97,8 @@ class SectionAdminViewSet(viewsets.ModelViewSet):
             items = request.data.get("orders", [])
             for it in items:
                 Section.objects.filter(id=it["id"]).update(order=it["order"])
+            # bulk update() sends no post_save; cached section rules are kept in section order
+            invalidate_section_rules()
             return Response({"updated": len(items)})
         except Exception as e:
             return Response(
@@ -268,6 +273,8 @@ class QuestionAdminViewSet(viewsets.ModelViewSet):
                 ]
                 if conds:
                     BranchingCondition.objects.bulk_create(conds)
+                    # bulk_create sends no post_save
+                    transaction.on_commit(invalidate_control_qcodes)
 
             return Response(QuestionAdminSerializer(q).data, status=status.HTTP_201_CREATED)
         except Exception as e:
@@ -553,27 +560,33 @@ class QuestionAdminViewSet(viewsets.ModelViewSet):
                     new_order = current_max + 1
                     max_order_map[section.id] = new_order
 
-                    # generate a unique code for new question
+                    # generate a unique code for new question: insert first and only
+                    # move to the next suffix when the unique index rejects the code
                     base_code = f"{src.code}_{slugify(sector).upper()}"
                     code_candidate = base_code or f"{src.code}_SECTOR"
                     idx = 1
-                    while Question.objects.filter(code=code_candidate).exists():
-                        code_candidate = f"{base_code}_{idx}"
-                        idx += 1
-
-                    q = Question.objects.create(
-                        section=section,
-                        code=code_candidate,
-                        text=src.text,
-                        help_text=src.help_text,
-                        type=src.type,
-                        required=src.required,
-                        order=new_order,
-                        max_score=src.max_score,
-                        weight=src.weight,
-                        is_active=getattr(src, "is_active", True),
-                        sector=sector,
-                    )
+                    while True:
+                        try:
+                            with transaction.atomic():  # savepoint: a taken code undoes only this insert
+                                q = Question.objects.create(
+                                    section=section,
+                                    code=code_candidate,
+                                    text=src.text,
+                                    help_text=src.help_text,
+                                    type=src.type,
+                                    required=src.required,
+                                    order=new_order,
+                                    max_score=src.max_score,
+                                    weight=src.weight,
+                                    is_active=getattr(src, "is_active", True),
+                                    sector=sector,
+                                )
+                            break
+                        except IntegrityError:
+                            if not Question.objects.filter(code=code_candidate).exists():
+                                raise
+                            code_candidate = f"{base_code}_{idx}"
+                            idx += 1
                     created_ids.append(q.id)
 
                     # Clone options
@@ -615,6 +628,8 @@ class QuestionAdminViewSet(viewsets.ModelViewSet):
                     ]
                     if conds:
                         BranchingCondition.objects.bulk_create(conds)
+                        # bulk_create sends no post_save
+                        transaction.on_commit(invalidate_control_qcodes)
 
             return Response(
                 {
@@ -755,6 +770,9 @@ class QuestionAdminViewSet(viewsets.ModelViewSet):
 
                 updated_questions = q_qs.update(sector=new_sector)
                 updated_organizations = o_qs.update(focus_sector=new_sector)
+                # bulk update() sends no post_save
+                transaction.on_commit(invalidate_spo_list)
+                transaction.on_commit(invalidate_focus_sectors)
 
             return Response(
                 {
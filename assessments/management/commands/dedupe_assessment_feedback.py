@@ -0,0 +1,33 @@
+# assessments/management/commands/dedupe_assessment_feedback.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from assessments.models import AssessmentFeedback
+
+
+class Command(BaseCommand):
+    help = (
+        "Keep only the newest AssessmentFeedback per assessment. "
+        "Run before the migration that makes AssessmentFeedback.assessment one-to-one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report the duplicates without deleting them")
+
+    def handle(self, *args, **options):
+        # newest row per assessment, the one FeedbackView used to return
+        keep = (
+            AssessmentFeedback.objects
+                .order_by("assessment_id", "-created_at", "-id")
+                .distinct("assessment_id")
+                .values("id")
+        )
+        duplicates = AssessmentFeedback.objects.exclude(id__in=keep)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{duplicates.count()} duplicate feedback row(s) would be deleted.")
+            return
+
+        with transaction.atomic():
+            deleted, _ = duplicates.delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} duplicate feedback row(s)."))
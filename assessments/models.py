@@ -2,6 +2,7 @@ from django.db import models
 from django.utils import timezone
 from django.contrib.postgres.fields import ArrayField
 from questionnaires.models import Question
+from config.encoders import ORJSONDecoder, ORJSONEncoder
 
 class Assessment(models.Model):
     STATUS_CHOICES = [
@@ -14,12 +15,15 @@ class Assessment(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
     cooldown_until = models.DateTimeField(null=True, blank=True)
-    progress = models.JSONField(default=dict, blank=True)  # cached counters
-    scores = models.JSONField(default=dict, blank=True)  # per-section + overall
+    progress = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder)  # cached counters
+    scores = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder)  # per-section + overall
     version = models.CharField(max_length=50, default="v1")
 
     class Meta:
         ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["organization", "status", "-submitted_at"]),
+        ]
 
     def __str__(self):
         return f"Assessment {self.id} - {self.organization.name}"
@@ -28,7 +32,7 @@ class Assessment(models.Model):
 class Answer(models.Model):
     assessment = models.ForeignKey(Assessment, on_delete=models.CASCADE, related_name="answers")
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name="answers")
-    data = models.JSONField(default=dict)  # {"value":...} / {"values":[...]} / {"values":{"dim":int}}
+    data = models.JSONField(default=dict, encoder=ORJSONEncoder, decoder=ORJSONDecoder)  # {"value":...} / {"values":[...]} / {"values":{"dim":int}}
     computed_points = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
     answered_at = models.DateTimeField(default=timezone.now)
 
@@ -43,6 +47,7 @@ class AssessmentFeedback(models.Model):
     Feedback record per assessment attempt (SPO).
     - 'reasons' are stored as codes (see REASONS below).
     - 'comment' is optional free text.
+    - at most one row per assessment (POST /api/feedback upserts it).
     """
     class Reason(models.TextChoices):
         HARD_TO_UNDERSTAND = "hard_to_understand", "Questions were difficult to understand"
@@ -51,7 +56,7 @@ class AssessmentFeedback(models.Model):
         COME_BACK_LATER    = "come_back_later",    "I will come back and complete it later"
         OTHER              = "other",              "Other"
 
-    assessment = models.ForeignKey(
+    assessment = models.OneToOneField(
         "assessments.Assessment",
         on_delete=models.CASCADE,
         related_name="feedback",
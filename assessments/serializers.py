@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from assessments.models import Assessment, AssessmentFeedback
 from questionnaires.models import Section, Question, AnswerOption, QuestionDimension
+from config.serializers import CachedFieldsMixin
 
 GRAPH_RANGES = {
     "RISK":   {"min": -20.0, "max": 100.0},
@@ -184,7 +185,7 @@ class AnswerUpsertSerializer(serializers.Serializer):
     question = serializers.CharField()
     data = serializers.JSONField()
 
-class AssessmentFeedbackSerializer(serializers.ModelSerializer):
+class AssessmentFeedbackSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     assessment = serializers.PrimaryKeyRelatedField(
         queryset=Assessment.objects.all(),
         required=True  # or False if your view sets it
@@ -204,4 +205,15 @@ class AssessmentFeedbackSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Invalid request context.")
         if a.organization.created_by_id != request.user.id:
             raise serializers.ValidationError("Not allowed for this assessment.")
-        return a
\ No newline at end of file
+        return a
+
+class AssessmentFeedbackUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
+    """
+    Plain validator for the feedback fields an SPO sends (reasons/comment only).
+    Skips the ModelSerializer's assessment lookup + ownership query; the view has already done both.
+    """
+    reasons = serializers.ListField(
+        child=serializers.ChoiceField(choices=AssessmentFeedback.Reason.choices),
+        allow_empty=True,
+    )
+    comment = serializers.CharField(allow_blank=True)
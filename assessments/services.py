@@ -1,23 +1,36 @@
-from questionnaires.logic import evaluate_rule, _load_section_rules, _normalize_to_100, _clamp_0_100
-from questionnaires.models import Section, Question
+from questionnaires.logic import compile_rule, normalize_answers, _load_section_rules, _normalize_to_100, _clamp_0_100, _to_decimal
+from django.core.cache import cache
+from questionnaires.cache import CONTROL_QCODES_KEY, CONTROL_QCODES_TTL
+from questionnaires.models import Section, Question, BranchingCondition
 from typing import Dict, Tuple, Any
 from questionnaires.utils import extract_q_refs
 
 def build_answers_map(assessment):
     sector = assessment.organization.focus_sector
-    answers = assessment.answers.select_related("question").filter(
-        question__sector=sector
+    # (assessment_id, question_id) is already covered by the unique_together index
+    return dict(
+        assessment.answers.filter(question__sector=sector).values_list("question__code", "data")
     )
 
-    return {a.question.code: a.data for a in answers}
-
-def visible_questions_for_section(assessment, section):
-    answers_map = build_answers_map(assessment)
+def visible_questions_for_section(assessment, section, answers_map=None):
+    # pass answers_map when looping over sections: one Answer query per request, not per section
+    if answers_map is None:
+        answers_map = build_answers_map(assessment)
+    answers = normalize_answers(answers_map)
     qs = section.questions.filter(sector=assessment.organization.focus_sector).prefetch_related("options", "dimensions", "conditions").order_by("order")
+    # identical logic compiles to the same closure, so repeated rules are evaluated once
+    results = {}
+
+    def holds(logic):
+        rule = compile_rule(logic)
+        if rule not in results:
+            results[rule] = rule(answers)
+        return results[rule]
+
     visible = []
     for q in qs:
-        conds = list(q.conditions.all())
-        if not conds or any(evaluate_rule(c.logic, answers_map) for c in conds):
+        conds = q.conditions.all()  # served from the prefetch cache, no copy needed
+        if not conds or any(holds(c.logic) for c in conds):
             visible.append(q)
     return visible
 
@@ -26,7 +39,7 @@ def compute_progress(assessment):
     progress = {"answered": 0, "required": 0, "by_section": {}}
 
     for sec in Section.objects.all().order_by("order"):
-        vis_qs = visible_questions_for_section(assessment, sec)
+        vis_qs = visible_questions_for_section(assessment, sec, answers_map)
         answered = 0
         required = 0
         for q in vis_qs:
@@ -47,13 +60,59 @@ def compute_progress(assessment):
 
     return progress
 
-def get_control_qcodes() -> set:
+def apply_progress_delta(assessment, changes, control_qcodes=None):
+    """
+    Incrementally update the cached ``assessment.progress`` counters.
+
+    `changes` is an iterable of (question, old_data, new_data) for the answers
+    that were just upserted. Only answered <-> unanswered flips move the counters.
+
+    Returns the updated progress dict, or None when a full compute_progress()
+    is required (no cached counters yet, or a change may alter branching visibility).
+    """
+    cached = assessment.progress if isinstance(assessment.progress, dict) else {}
+    by_section = cached.get("by_section")
+    if not by_section or "answered" not in cached or "required" not in cached:
+        return None
+
+    if control_qcodes is None:
+        control_qcodes = get_control_qcodes()
+
+    sector = assessment.organization.focus_sector
+    progress = {
+        **cached,
+        "by_section": {code: dict(stats) for code, stats in by_section.items()},
+    }
+
+    for q, old_data, new_data in changes:
+        # answering a control question can show/hide other questions
+        if q.code in control_qcodes or q.conditions.all():
+            return None
+        if q.sector != sector:
+            continue  # not part of this organization's questionnaire
+        sec_stats = progress["by_section"].get(q.section.code)
+        if sec_stats is None:
+            return None
+
+        delta = int(bool(new_data)) - int(bool(old_data))
+        if delta:
+            sec_stats["answered"] += delta
+            progress["answered"] += delta
+
+    total_req = progress["required"]
+    progress["percent"] = int(round((progress["answered"] / total_req) * 100)) if total_req else 0
+    return progress
+
+def _query_control_qcodes() -> set:
     control = set()
-    for q in Question.objects.filter(is_active=True).prefetch_related("conditions").all():
-        for cond in q.conditions.all():
-            control |= extract_q_refs(cond.logic)
+    for logic in BranchingCondition.objects.filter(question__is_active=True).values_list("logic", flat=True):
+        control |= extract_q_refs(logic)
     return control
 
+def get_control_qcodes() -> set:
+    # served from the cache; question/condition saves invalidate it
+    return cache.get_or_set(CONTROL_QCODES_KEY, _query_control_qcodes, CONTROL_QCODES_TTL)
+
 def question_points(q: Question, ans: dict) -> float:
     """Compute raw points for a single question from its answer payload."""
     if not ans:
@@ -147,7 +206,7 @@ def compute_scores(assessment) -> Tuple[Dict, Dict]:
         if sec.code == "FEEDBACK":
             continue
 
-        visible = visible_questions_for_section(assessment, sec)
+        visible = visible_questions_for_section(assessment, sec, answers_map)
         if not visible:
             continue
 
@@ -192,7 +251,7 @@ def compute_scores(assessment) -> Tuple[Dict, Dict]:
         if not rule:
             continue
 
-        w = Decimal(str(rule.weight or 0))
+        w = _to_decimal(rule.weight or 0)
         if w <= 0:
             continue
 
@@ -392,4 +392,65 @@ def test_pdf_report_endpoint(api_client):
     r = client.get(url)
     assert r.status_code == 200
     # Accept either PDF or HTML fallback
-    assert r["Content-Type"] in ["application/pdf", "text/html"]
\ No newline at end of file
+    assert r["Content-Type"] in ["application/pdf", "text/html"]
+
+
+def test_incremental_progress_matches_full_recompute(api_client, monkeypatch):
+    import assessments.views
+    from assessments.services import compute_progress
+
+    client, user = api_client
+    assessment = Assessment.objects.create(organization=user.organization)
+    ans_url = reverse("assessment-save-answers", args=[assessment.id])
+
+    # first save seeds the cached counters
+    client.patch(ans_url, {"answers": [{"question": "RET_Q1", "data": {"value": 4}}]}, format="json")
+
+    # later saves only touch non-control questions -> delta path, no full recompute
+    def _no_full_recompute(assessment):
+        raise AssertionError("compute_progress() called on the delta path")
+
+    monkeypatch.setattr(assessments.views, "compute_progress", _no_full_recompute)
+    resp = client.patch(ans_url, {"answers": [
+        {"question": "RISK_Q1", "data": {"values": ["OP"]}},
+        {"question": "SEC_Q1", "data": {"value": 3}},
+        {"question": "RET_Q1", "data": {}},
+    ]}, format="json")
+    assert resp.status_code == 200
+
+    assessment.refresh_from_db()
+    expected = compute_progress(assessment)
+    progress = resp.json()["progress"]
+    assert progress["answered"] == expected["answered"]
+    assert progress["percent"] == expected["percent"]
+    assert progress["by_section"] == expected["by_section"]
+
+
+def test_progress_delta_falls_back_when_branching_may_change(api_client):
+    from assessments.services import apply_progress_delta, compute_progress
+
+    client, user = api_client
+    assessment = Assessment.objects.create(organization=user.organization)
+    assessment.progress = compute_progress(assessment)
+
+    plain = Question.objects.get(code="SEC_Q1")
+    assert apply_progress_delta(assessment, [(plain, None, {"value": 3})]) is not None
+
+    # IMP_Q1 controls IMP_Q2's visibility; IMP_Q2 carries a condition
+    control = Question.objects.get(code="IMP_Q1")
+    assert apply_progress_delta(assessment, [(control, None, {"value": "YES"})]) is None
+    conditional = Question.objects.get(code="IMP_Q2")
+    assert conditional.conditions.exists()
+    assert apply_progress_delta(assessment, [(conditional, None, {"value": "x"})]) is None
+
+
+def test_control_qcodes_follow_condition_changes():
+    from questionnaires.models import BranchingCondition
+    from assessments.services import get_control_qcodes
+
+    q = Question.objects.filter(is_active=True).exclude(code="RISK_Q1").first()
+    assert "CTRL_X" not in get_control_qcodes()
+    cond = BranchingCondition.objects.create(question=q, logic={"q": "CTRL_X", "op": "eq", "val": "YES"})
+    assert "CTRL_X" in get_control_qcodes()
+    cond.delete()
+    assert "CTRL_X" not in get_control_qcodes()
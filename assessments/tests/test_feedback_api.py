@@ -70,4 +70,43 @@ class TestSPOFeedbackAPI:
         )
         # validation should reject because 'other' doesn't own this assessment's org
         assert r.status_code == 400
-        assert "not allowed" in str(r.data).lower()
\ No newline at end of file
+        assert "not allowed" in str(r.data).lower()
+
+    def test_feedback_get_empty_shape(self):
+        u, org = self._spo()
+        a = Assessment.objects.create(organization=org, status="DRAFT")
+
+        c = APIClient()
+        c.force_authenticate(user=u)
+
+        r = c.get(f"/api/feedback?assessment_id={a.id}")
+        assert r.status_code == 200
+        assert r.json() == {"assessment": a.id, "reasons": [], "comment": "", "created_at": None}
+
+    def test_feedback_rejects_non_integer_id(self):
+        u, org = self._spo()
+        c = APIClient()
+        c.force_authenticate(user=u)
+
+        r = c.get("/api/feedback", {"assessment_id": "abc"})
+        assert r.status_code == 400
+
+        r = c.post("/api/feedback", {"assessment": "abc", "reasons": ["too_long"]}, format="json")
+        assert r.status_code == 400
+
+    def test_feedback_create_reads_the_assessment_once(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        u, org = self._spo()
+        a = Assessment.objects.create(organization=org, status="SUBMITTED")
+        c = APIClient()
+        c.force_authenticate(user=u)
+
+        with CaptureQueriesContext(connection) as ctx:
+            r = c.post("/api/feedback", {"assessment": a.id, "reasons": ["too_long"]}, format="json")
+        assert r.status_code == 200
+        assert AssessmentFeedback.objects.get(assessment=a).reasons == ["too_long"]
+        reads = [q for q in ctx.captured_queries if q["sql"].startswith('SELECT "assessments_assessment"')]
+        assert len(reads) == 1
+
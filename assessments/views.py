@@ -6,6 +6,7 @@ from rest_framework import status, serializers
 from weasyprint import HTML
 from django.template.loader import render_to_string
 from django.http import HttpResponse
+from django.db import transaction
 from django.utils import timezone
 from admin_portal.models import AdminConfig
 from django.shortcuts import get_object_or_404
@@ -19,7 +20,7 @@ from assessments.serializers import (
     AnswerUpsertSerializer,
 )
 from questionnaires.models import Section, Question
-from assessments.services import build_answers_map, visible_questions_for_section, compute_progress
+from assessments.services import build_answers_map, visible_questions_for_section, compute_progress, apply_progress_delta
 from assessments.services import get_control_qcodes
 from questionnaires.logic import eligibility_check
 
@@ -288,8 +289,8 @@ class QuestionsView(APIView):
             section_code = request.query_params.get("section")
             assessment = get_object_or_404(Assessment, pk=pk, organization=request.user.organization)
             sec = get_object_or_404(Section, code=section_code)
-            visible = visible_questions_for_section(assessment, sec)
             answers_map = build_answers_map(assessment)
+            visible = visible_questions_for_section(assessment, sec, answers_map)
             control_set = get_control_qcodes()
             ser = QuestionSerializer(visible, many=True, context={"answers_map": answers_map, "control_set": control_set })
             return Response({"section": sec.code, "questions": ser.data})
@@ -372,44 +373,62 @@ class SaveAnswersView(APIView):
     )
     def patch(self, request, pk):
         try:
-            assessment = get_object_or_404(
-                Assessment, pk=pk, organization=request.user.organization
-            )
-            if assessment.status != "DRAFT":
-                return Response({"message": "Assessment is submitted and cannot be modified.", "errors": {}},
-                                status=status.HTTP_400_BAD_REQUEST)
-            serializer = AnswerUpsertSerializer(data=request.data.get("answers", []), many=True)
-            serializer.is_valid(raise_exception=True)
-
-            for item in serializer.validated_data:
-                q_code = item["question"]
-                data = item["data"]
-                try:
-                    q = Question.objects.get(code=q_code)
-                except Question.DoesNotExist:
-                    return Response(
-                        {"message": f"Invalid question code {q_code}", "errors": {}},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                Answer.objects.update_or_create(assessment=assessment, question=q, defaults={"data": data})
-
-            section_code = request.query_params.get("section")
-            if not section_code and serializer.validated_data:
-                first_q = Question.objects.filter(code=serializer.validated_data[0]["question"], is_active=True).select_related("section").first()
-                if first_q:
-                    section_code = first_q.section.code
+            with transaction.atomic():
+                # row lock: concurrent PATCHes apply their progress deltas one after another
+                assessment = get_object_or_404(
+                    Assessment.objects.select_for_update(), pk=pk, organization=request.user.organization
+                )
+                if assessment.status != "DRAFT":
+                    return Response({"message": "Assessment is submitted and cannot be modified.", "errors": {}},
+                                    status=status.HTTP_400_BAD_REQUEST)
+                serializer = AnswerUpsertSerializer(data=request.data.get("answers", []), many=True)
+                serializer.is_valid(raise_exception=True)
+
+                codes = [item["question"] for item in serializer.validated_data]
+                qmap = {
+                    q.code: q
+                    for q in Question.objects.filter(code__in=codes)
+                        .select_related("section")
+                        .prefetch_related("conditions")
+                }
+                for q_code in codes:
+                    if q_code not in qmap:
+                        return Response(
+                            {"message": f"Invalid question code {q_code}", "errors": {}},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
 
-            # recompute progress (+ percent)
-            progress = compute_progress(assessment)
-            if section_code:
-                progress["last_section"] = section_code
-
-            assessment.progress = progress
-            assessment.save(update_fields=["progress"])
-            return Response({
-                "progress": assessment.progress,
-                "resume": {"last_section": progress.get("last_section")}
-            })
+                previous = dict(
+                    Answer.objects.filter(assessment=assessment, question__code__in=codes)
+                        .values_list("question__code", "data")
+                )
+                changes = []
+                for item in serializer.validated_data:
+                    q = qmap[item["question"]]
+                    data = item["data"]
+                    Answer.objects.update_or_create(assessment=assessment, question=q, defaults={"data": data})
+                    changes.append((q, previous.get(q.code), data))
+                    previous[q.code] = data
+
+                section_code = request.query_params.get("section")
+                if not section_code and serializer.validated_data:
+                    first_q = qmap[codes[0]]
+                    if first_q.is_active:
+                        section_code = first_q.section.code
+
+                # update cached counters for the patched answers; full recompute only when needed
+                progress = apply_progress_delta(assessment, changes)
+                if progress is None:
+                    progress = compute_progress(assessment)
+                if section_code:
+                    progress["last_section"] = section_code
+
+                assessment.progress = progress
+                assessment.save(update_fields=["progress"])
+                return Response({
+                    "progress": assessment.progress,
+                    "resume": {"last_section": progress.get("last_section")}
+                })
         except Exception as e:
             return Response(
                 {"message": "We could not save the answers right now. Please try again later.", "errors": str(e)},
@@ -4,15 +4,25 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
+from django.db import transaction
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
 from assessments.models import Assessment, AssessmentFeedback
-from assessments.serializers import AssessmentFeedbackSerializer
-from notifications.email import send_spo_abandoned_email
+from assessments.serializers import AssessmentFeedbackSerializer, AssessmentFeedbackUpdateSerializer
+from notifications.email import spo_abandoned_context
+from notifications.tasks import send_spo_abandoned_email_async
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+FEEDBACK_UPDATE_FIELDS = {"assessment", "reasons", "comment"}
+
+# Reason choices are static, build the payload (and its JSON body) once
+FEEDBACK_REASONS = [{"key": key, "label": label} for key, label in AssessmentFeedback.Reason.choices]
+FEEDBACK_META_BODY = orjson.dumps({"reasons": FEEDBACK_REASONS})
+
 @extend_schema(
     tags=["SPO • Feedback"],
     operation_id="feedback_meta",
@@ -42,8 +52,7 @@ logger = logging.getLogger(__name__)
 @permission_classes([IsAuthenticated])
 def feedback_meta(request):
     try:
-        reasons = [{"key": key, "label": label} for key, label in AssessmentFeedback.Reason.choices]
-        return Response({"reasons": reasons}, status=200)
+        return HttpResponse(FEEDBACK_META_BODY, content_type="application/json", status=200)
     except Exception as e:
         return Response(
             {"message": "We could not fetch the feedback meta right now. Please try again later.", "errors": str(e)},
@@ -72,29 +81,50 @@ class FeedbackView(APIView):
             aid = request.data.get("assessment")
             if not aid:
                 return Response({"message": "assessment is required", "errors": { "assessment": ["This field is required."] }}, status=400)
+            try:
+                aid = int(aid)
+            except (TypeError, ValueError):
+                return Response({"message": "Invalid assessment", "errors": {"assessment": ["A valid integer is required."]}}, status=400)
 
-            a = get_object_or_404(Assessment, pk=aid)
-            if a.organization.created_by_id != request.user.id:
+            # ownership is part of the WHERE clause: the reject path ships no row at all
+            a = (
+                Assessment.objects
+                    .select_related("organization", "feedback")
+                    .filter(pk=aid, organization__created_by_id=request.user.id)
+                    .first()
+            )
+            if a is None:
                 return Response({"message": "Not allowed", "errors" : {"assessment": ["Not allowed for this assessment."]}}, status=400)
 
-            # UPSERT
-            inst, _ = AssessmentFeedback.objects.get_or_create(assessment=a)
-            ser = AssessmentFeedbackSerializer(
-                inst, data=request.data, partial=True, context={"request": request}
-            )
+            # fast path: row exists and only reasons/comment change -> one targeted UPDATE
+            fb = getattr(a, "feedback", None)
+            if fb is not None and set(request.data.keys()) <= FEEDBACK_UPDATE_FIELDS:
+                upd = AssessmentFeedbackUpdateSerializer(data=request.data, partial=True)
+                upd.is_valid(raise_exception=True)
+                if upd.validated_data:
+                    AssessmentFeedback.objects.filter(pk=fb.pk).update(**upd.validated_data)
+                    for field, value in upd.validated_data.items():
+                        setattr(fb, field, value)
+                return Response(AssessmentFeedbackSerializer(fb).data, status=status.HTTP_200_OK)
 
-            try:
-                if _ and a.status == "DRAFT":
-                    send_spo_abandoned_email(
-                        spo=request.user,
-                        org=a.organization,
-                        assessment=a,
-                        recorded_at=inst.created_at,
-                    )
-            except Exception as e:
-                logger.info("Failed to send SPO abandoned email for assessment %s: %s", a.id, e)
+            # ownership and the assessment row are settled above: validate only reasons/comment
+            ser = AssessmentFeedbackUpdateSerializer(data=request.data, partial=True)
             ser.is_valid(raise_exception=True)
-            ser.save(assessment=a)
+
+            # UPSERT
+            inst, created = AssessmentFeedback.objects.update_or_create(assessment_id=a.id, defaults=ser.validated_data)
+
+            if created and a.status == "DRAFT":
+                # plain data only: the worker renders the mail without ORM access
+                ctx = spo_abandoned_context(
+                    spo=request.user,
+                    org=a.organization,
+                    assessment=a,
+                    recorded_at=inst.created_at,
+                )
+                transaction.on_commit(lambda: send_spo_abandoned_email_async(ctx))
+
+            ser = AssessmentFeedbackSerializer(inst, context={"request": request})
             return Response(ser.data, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -113,20 +143,30 @@ class FeedbackView(APIView):
             aid = request.query_params.get("assessment_id")
             if not aid:
                 return Response({"message": "assessment_id is required"}, status=400)
-            a = get_object_or_404(Assessment, pk=aid, organization=request.user.organization)
-            fb = AssessmentFeedback.objects.filter(assessment=a).order_by("-created_at").first()
+            try:
+                aid = int(aid)
+            except (TypeError, ValueError):
+                return Response({"message": "assessment_id must be an integer"}, status=400)
+            # one SELECT: assessment (ownership) + its feedback row via the reverse one-to-one
+            a = get_object_or_404(
+                Assessment.objects
+                    .select_related("feedback")
+                    .only("id", "feedback__assessment_id", "feedback__reasons", "feedback__comment", "feedback__created_at"),
+                pk=aid,
+                organization__created_by_id=request.user.id,
+            )
+            fb = getattr(a, "feedback", None)
 
-            # if none exists, return an empty shape the frontend/test expects
+            # if none exists, return an empty shape the frontend/test expects;
+            # constant shape, so skip DRF's renderer/content negotiation
             if not fb:
-                return Response(
-                    {
-                        "assessment": a.id,
-                        "reasons": [],
-                        "comment": "",
-                        "created_at": None,
-                    },
-                    status=200,
-                )
+                body = orjson.dumps({
+                    "assessment": a.id,
+                    "reasons": [],
+                    "comment": "",
+                    "created_at": None,
+                })
+                return HttpResponse(body, content_type="application/json", status=200)
 
             # serialize a SINGLE instance (not the manager/queryset)
             ser = AssessmentFeedbackSerializer(fb, context={"request": request})
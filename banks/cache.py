@@ -0,0 +1,24 @@
+# banks/cache.py
+import hashlib
+import time
+
+from django.core.cache import cache
+
+# The SPO list is the same for every bank user, so responses are cached per
+# query string. Invalidation bumps a version stamp instead of deleting keys.
+SPO_LIST_TTL = 60
+SPO_LIST_VERSION_KEY = "bank_spo_list:version"
+
+
+def _spo_list_version():
+    return cache.get_or_set(SPO_LIST_VERSION_KEY, time.time_ns, None)
+
+
+def spo_list_cache_key(query_params) -> str:
+    items = sorted((k, v) for k in query_params for v in query_params.getlist(k))
+    digest = hashlib.md5(repr(items).encode(), usedforsecurity=False).hexdigest()
+    return f"bank_spo_list:v1:{_spo_list_version()}:{digest}"
+
+
+def invalidate_spo_list():
+    cache.set(SPO_LIST_VERSION_KEY, time.time_ns(), None)
@@ -6,5 +6,10 @@ class IsBankUser(BasePermission):
     Allow only users with role=BANK_USER
     """
     def has_permission(self, request, view):
-        u = getattr(request, "user", None)
-        return bool(u and u.is_authenticated and getattr(u, "role", None) == "BANK_USER")
\ No newline at end of file
+        # memoized on the request so composed/repeated checks don't redo it
+        allowed = getattr(request, "_is_bank_user", None)
+        if allowed is None:
+            u = request.user
+            allowed = bool(u and u.is_authenticated and u.role == "BANK_USER")
+            request._is_bank_user = allowed
+        return allowed
@@ -0,0 +1,152 @@
+# banks/reports.py
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from assessments.models import Assessment
+
+
+def spo_report_context(spo) -> dict:
+    """
+    Template context for bank_portal/spo_report.html.
+    All DB reads happen here, so rendering the PDF needs no ORM access.
+    """
+    org = getattr(spo, "organization", None)
+    assessments = (
+        Assessment.objects
+            .filter(organization=org)
+            .select_related("loan_eligibility")
+            # only the columns the report renders (skips progress/cooldown/version etc.)
+            .only(
+                "id", "status", "started_at", "submitted_at", "scores",
+                "loan_eligibility__assessment_id", "loan_eligibility__overall_score",
+                "loan_eligibility__is_eligible", "loan_eligibility__details",
+            )
+            .order_by("-submitted_at", "-started_at")
+    )
+
+    rows = []
+    for a in assessments:
+        e = getattr(a, "loan_eligibility", None)
+        rows.append({
+            "id": a.id,
+            "status": a.status,
+            "started_at": a.started_at,
+            "submitted_at": a.submitted_at,
+            "scores": a.scores or {},
+            "eligibility": {
+                "overall": float(e.overall_score) if e else None,
+                "decision": bool(e.is_eligible) if e else None,
+                "reason": (e.details or {}).get("reason") if e else None,
+            }
+        })
+
+    # plain values only: the context is handed to a render thread
+    return {
+        "generated_at": timezone.now(),
+        "spo": {
+            "id": spo.id,
+            "email": spo.email,
+            "first_name": spo.first_name,
+            "last_name": spo.last_name,
+            "is_active": spo.is_active,
+            "date_joined": spo.date_joined,
+        },
+        "org": {
+            "name": org.name,
+            "registration_type": org.registration_type,
+            "focus_sector": org.focus_sector,
+        } if org else None,
+        "assessments": rows,
+    }
+
+
+REPORT_PDF_TTL = 60 * 60
+REPORT_CSS_PATH = settings.BASE_DIR / "templates" / "bank_portal" / "spo_report.css"
+
+# FontConfiguration (fontconfig scan) + parsed report CSS, built once per thread:
+# WeasyPrint objects aren't documented as thread-safe and reports render on a pool.
+_weasy_local = threading.local()
+
+
+def _weasy_assets():
+    assets = getattr(_weasy_local, "assets", None)
+    if assets is None:
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
+        font_config = FontConfiguration()
+        stylesheets = [CSS(filename=str(REPORT_CSS_PATH), font_config=font_config)]
+        assets = _weasy_local.assets = (font_config, stylesheets)
+    return assets
+
+
+def spo_report_fingerprint(ctx: dict) -> str:
+    """
+    Digest of everything the report shows except `generated_at`:
+    same fingerprint -> byte-identical content, so the rendered PDF can be reused.
+    """
+    data = {k: v for k, v in ctx.items() if k != "generated_at"}
+    return hashlib.blake2b(orjson.dumps(data, default=str), digest_size=16).hexdigest()
+
+
+def _report_dir() -> Path:
+    path = Path(settings.BANK_REPORT_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def cached_spo_report_pdf(fingerprint: str) -> Path | None:
+    """Path of a still-fresh rendered PDF for `fingerprint`, else None."""
+    path = _report_dir() / f"{fingerprint}.pdf"
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    return path if age < REPORT_PDF_TTL else None
+
+
+def get_or_render_spo_report_pdf(ctx: dict, fingerprint: str | None = None) -> Path:
+    """
+    PDFs live on disk keyed by fingerprint, so responses can stream them with
+    FileResponse instead of holding the whole document in memory.
+    """
+    fingerprint = fingerprint or spo_report_fingerprint(ctx)
+    path = cached_spo_report_pdf(fingerprint)
+    if path is None:
+        path = _report_dir() / f"{fingerprint}.pdf"
+        render_spo_report_pdf(ctx, path)
+    return path
+
+
+def _prune_stale_reports():
+    cutoff = time.time() - REPORT_PDF_TTL
+    for path in _report_dir().glob("*.pdf"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def render_spo_report_pdf(ctx: dict, target: Path) -> None:
+    html = render_to_string("bank_portal/spo_report.html", ctx)
+    from weasyprint import HTML as WEASY_HTML
+    font_config, stylesheets = _weasy_assets()
+    # write beside the final name, then rename: readers never see a partial file
+    tmp = tempfile.NamedTemporaryFile(dir=target.parent, suffix=".part", delete=False)
+    try:
+        with tmp:
+            WEASY_HTML(string=html).write_pdf(target=tmp, stylesheets=stylesheets, font_config=font_config)
+        os.replace(tmp.name, target)
+    except Exception:
+        os.unlink(tmp.name)
+        raise
+    _prune_stale_reports()
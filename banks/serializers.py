@@ -1,6 +1,43 @@
 # banks/serializers.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
 from rest_framework import serializers
 
+# Bank portal responses are read-only, so the views build these rows and dump
+# them with orjson directly. The serializers below are kept as the OpenAPI schema.
+
+@dataclass(slots=True)
+class BankSPORow:
+    id: int
+    email: str
+    first_name: str
+    last_name: str
+    is_active: bool
+    date_joined: datetime
+    organization_name: str
+    focus_sector: str
+    org_created_at: Optional[datetime]
+    last_assessment_submitted_at: Optional[datetime]
+    last_loan_request_submitted_at: Optional[datetime]
+    instrument: Optional[dict]
+    scores: Optional[dict]
+
+
+@dataclass(slots=True)
+class BankSPOAssessmentRow:
+    id: int
+    status: str
+    started_at: Optional[datetime]
+    submitted_at: Optional[datetime]
+    scores: dict
+    eligibility_overall: Optional[float]
+    eligibility_decision: Optional[bool]
+    eligibility_reason: Optional[str]
+    loan_request_id: Optional[int]
+
+
 class BankSPOListItemSerializer(serializers.Serializer):
     """
     Row for SPOs Management table
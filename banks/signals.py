@@ -0,0 +1,30 @@
+# banks/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import User
+from assessments.models import Assessment
+from organizations.models import Organization
+from questionnaires.models import LoanEligibilityResult, LoanRequest
+from banks.cache import invalidate_spo_list
+
+# columns the SPO list reads; a save limited to other fields (the answer autosave
+# of Assessment.progress, the last_login bump on login) leaves the list as it was
+SPO_LIST_FIELDS = {
+    Assessment: {"status", "submitted_at"},
+    User: {"email", "first_name", "last_name", "is_active"},
+}
+
+
+@receiver([post_save, post_delete], sender=Assessment)
+@receiver([post_save, post_delete], sender=LoanRequest)
+@receiver([post_save, post_delete], sender=LoanEligibilityResult)
+@receiver([post_save, post_delete], sender=Organization)
+@receiver([post_save, post_delete], sender=User)
+def invalidate_bank_spo_list(sender, instance, update_fields=None, **kwargs):
+    if sender is User and instance.role != User.Role.SPO:
+        return
+    listed = SPO_LIST_FIELDS.get(sender)
+    if update_fields is not None and listed is not None and listed.isdisjoint(update_fields):
+        return
+    invalidate_spo_list()
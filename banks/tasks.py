@@ -0,0 +1,124 @@
+# banks/tasks.py
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+
+from banks.reports import (
+    spo_report_context,
+    spo_report_fingerprint,
+    cached_spo_report_pdf,
+    get_or_render_spo_report_pdf,
+)
+
+logger = logging.getLogger(__name__)
+
+# No task broker is deployed, so PDF rendering runs on a small in-process pool
+# (settings.BANK_REPORT_WORKERS). Job state is a small JSON file next to the PDFs
+# in BANK_REPORT_DIR, keyed by the report fingerprint, so a poll answered by any
+# worker process sees it and identical requests share one render.
+REPORT_JOB_TTL = 60 * 60
+# a PENDING job older than this is assumed lost (e.g. its worker restarted) and is re-queued
+REPORT_JOB_STALE_AFTER = 5 * 60
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BANK_REPORT_WORKERS, thread_name_prefix="bank-reports"
+                )
+    return _executor
+
+
+def _jobs_dir() -> Path:
+    path = Path(settings.BANK_REPORT_DIR) / "jobs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _job_path(job_id: str) -> Path:
+    return _jobs_dir() / f"{job_id}.json"
+
+
+def _write_job(job_id: str, job: dict) -> None:
+    # write beside the final name, then rename: polls never see a partial file
+    path = _job_path(job_id)
+    tmp = path.with_suffix(".part")
+    tmp.write_bytes(orjson.dumps(job))
+    os.replace(tmp, path)
+
+
+def _prune_stale_jobs():
+    cutoff = time.time() - REPORT_JOB_TTL
+    for path in _jobs_dir().glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _run_spo_report(job_id, spo_id, ctx, fingerprint):
+    try:
+        get_or_render_spo_report_pdf(ctx, fingerprint)
+        _write_job(job_id, {"state": "READY", "spo_id": spo_id, "fingerprint": fingerprint})
+    except Exception as e:
+        logger.exception("Failed to render SPO report job=%s spo=%s", job_id, spo_id)
+        _write_job(job_id, {"state": "FAILED", "spo_id": spo_id, "error": str(e)})
+    _prune_stale_jobs()
+
+
+def enqueue_spo_report(spo, ctx=None, fingerprint=None) -> tuple[str, dict]:
+    """
+    Queue the report render for `spo`, or join the job already queued for the
+    same report data. Returns (job_id, job); poll with get_spo_report_job().
+    """
+    if ctx is None:
+        ctx = spo_report_context(spo)
+    if fingerprint is None:
+        fingerprint = spo_report_fingerprint(ctx)
+    job_id = fingerprint
+
+    job = get_spo_report_job(job_id)
+    if job is not None:
+        if job["state"] == "READY" and cached_spo_report_pdf(fingerprint) is not None:
+            return job_id, job
+        if job["state"] == "PENDING" and time.time() - job.get("queued_at", 0) < REPORT_JOB_STALE_AFTER:
+            return job_id, job
+
+    job = {"state": "PENDING", "spo_id": spo.id, "queued_at": time.time()}
+    _write_job(job_id, job)
+    _get_executor().submit(_run_spo_report, job_id, spo.id, ctx, fingerprint)
+    return job_id, job
+
+
+def wait_for_spo_report_job(job_id: str, timeout: float) -> dict | None:
+    """Poll the job file until it leaves PENDING or `timeout` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = get_spo_report_job(job_id)
+        if job is None or job["state"] != "PENDING" or time.monotonic() >= deadline:
+            return job
+        time.sleep(0.05)
+
+
+def get_spo_report_job(job_id: str) -> dict | None:
+    path = _job_path(job_id)
+    try:
+        if time.time() - path.stat().st_mtime >= REPORT_JOB_TTL:
+            return None
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
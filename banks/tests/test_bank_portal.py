@@ -1,5 +1,6 @@
 # banks/tests/test_bank_portal.py
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -78,4 +79,222 @@ def test_bank_spo_report_pdf(bank_user, spo_with_data):
     r = c.get(f"/api/bank/spos/{spo.id}/report/")
     assert r.status_code == 200
     assert r["Content-Type"] == "application/pdf"
-    assert r["Content-Disposition"].startswith(f'attachment; filename="bank-spo-{spo.id}.pdf"')
\ No newline at end of file
+    assert r["Content-Disposition"].startswith(f'attachment; filename="bank-spo-{spo.id}.pdf"')
+
+
+def _make_eligible_spo(i):
+    spo = User.objects.create_user(email=f"spo{i}@x.com", password="Pass123!", role=User.Role.SPO)
+    org = Organization.objects.create(
+        name=f"Org {i}",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=spo,
+    )
+    a = Assessment.objects.create(organization=org, status="SUBMITTED", submitted_at=timezone.now())
+    LoanEligibilityResult.objects.create(
+        assessment=a, overall_score=70, is_eligible=True, details={"sections": {}}, evaluated_at=timezone.now()
+    )
+    return spo
+
+
+@pytest.mark.django_db
+def test_bank_spo_list_query_count_does_not_grow_with_rows():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+
+    _make_eligible_spo(0)
+    with CaptureQueriesContext(connection) as one_row:
+        assert c.get("/api/bank/spos/").status_code == 200
+
+    for i in range(1, 4):
+        _make_eligible_spo(i)
+    with CaptureQueriesContext(connection) as many_rows:
+        r = c.get("/api/bank/spos/")
+        assert r.status_code == 200
+    assert r.json()["count"] == 4
+    assert len(many_rows) == len(one_row)
+
+
+@pytest.mark.django_db
+def test_bank_spo_list_cache_invalidated_on_new_data():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+
+    _make_eligible_spo(0)
+    with CaptureQueriesContext(connection) as miss:
+        assert c.get("/api/bank/spos/").json()["count"] == 1
+    # second call is served from cache
+    with CaptureQueriesContext(connection) as hit:
+        assert c.get("/api/bank/spos/").json()["count"] == 1
+    assert len(hit) < len(miss)
+
+    _make_eligible_spo(1)
+    assert c.get("/api/bank/spos/").json()["count"] == 2
+
+
+@pytest.mark.django_db
+def test_bank_spo_list_cache_survives_answer_autosave():
+    from banks.cache import SPO_LIST_VERSION_KEY
+
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spo = _make_eligible_spo(0)
+    c.get("/api/bank/spos/")
+    version = cache.get(SPO_LIST_VERSION_KEY)
+
+    a = Assessment.objects.filter(organization=spo.organization).first()
+    a.progress = {"answered": 1, "required": 2}
+    a.save(update_fields=["progress"])
+    spo.save(update_fields=["last_login"])
+    assert cache.get(SPO_LIST_VERSION_KEY) == version
+
+    a.save(update_fields=["status"])
+    assert cache.get(SPO_LIST_VERSION_KEY) != version
+
+
+@pytest.mark.django_db
+def test_bank_spo_list_cursor_pagination():
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spos = [_make_eligible_spo(i) for i in range(3)]
+
+    first = c.get("/api/bank/spos/?limit=2").json()
+    assert first["count"] == 3
+    assert [r["id"] for r in first["results"]] == [spos[2].id, spos[1].id]
+    assert first["next_cursor"] == spos[1].id
+
+    second = c.get(f"/api/bank/spos/?limit=2&cursor={first['next_cursor']}").json()
+    assert [r["id"] for r in second["results"]] == [spos[0].id]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.django_db
+def test_bank_spo_report_job_flow():
+    import time
+
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spo = _make_eligible_spo(0)
+
+    r = c.post(f"/api/bank/spos/{spo.id}/report/jobs/")
+    assert r.status_code == 202
+    status_url = r.json()["status_url"]
+    # job state must not live in the per-process cache: another worker answers the polls
+    cache.clear()
+
+    for _ in range(50):
+        body = c.get(status_url).json()
+        if body["state"] != "PENDING":
+            break
+        time.sleep(0.1)
+    assert body["state"] == "READY"
+
+    r = c.get(body["download_url"])
+    assert r.status_code == 200
+    assert r["Content-Type"] == "application/pdf"
+    assert r["Content-Disposition"].startswith(f'attachment; filename="bank-spo-{spo.id}.pdf"')
+
+    assert c.get("/api/bank/spos/report-jobs/" + "0" * 32 + "/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_bank_spo_report_queues_render_instead_of_blocking(settings, monkeypatch, tmp_path):
+    import banks.tasks
+
+    class _Idle:
+        submitted = []
+
+        def submit(self, *args):
+            self.submitted.append(args)
+
+    idle = _Idle()
+    monkeypatch.setattr(banks.tasks, "_get_executor", lambda: idle)
+    settings.BANK_REPORT_SYNC_WAIT = 0
+    # this job never finishes; keep it out of the shared report dir
+    settings.BANK_REPORT_DIR = tmp_path
+
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spo = _make_eligible_spo(0)
+
+    # render not finished yet -> 202 with the job to poll, nothing rendered on the request thread
+    r = c.get(f"/api/bank/spos/{spo.id}/report/")
+    assert r.status_code == 202
+    body = r.json()
+    assert body["state"] == "PENDING"
+    assert c.get(body["status_url"]).json()["state"] == "PENDING"
+
+    # the same report data joins the queued job instead of rendering again
+    assert c.get(f"/api/bank/spos/{spo.id}/report/").json()["job_id"] == body["job_id"]
+    assert c.post(f"/api/bank/spos/{spo.id}/report/jobs/").json()["job_id"] == body["job_id"]
+    assert len(idle.submitted) == 1
+
+
+@pytest.mark.django_db
+def test_bank_spo_report_etag_not_modified():
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spo = _make_eligible_spo(0)
+
+    r = c.get(f"/api/bank/spos/{spo.id}/report/")
+    assert r.status_code == 200
+    etag = r["ETag"]
+
+    r = c.get(f"/api/bank/spos/{spo.id}/report/", HTTP_IF_NONE_MATCH=etag)
+    assert r.status_code == 304
+
+    Assessment.objects.create(organization=spo.organization, status="DRAFT")
+    r = c.get(f"/api/bank/spos/{spo.id}/report/", HTTP_IF_NONE_MATCH=etag)
+    assert r.status_code == 200
+    assert r["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_bank_spo_detail_etag_not_modified():
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    spo = _make_eligible_spo(0)
+
+    r = c.get(f"/api/bank/spos/{spo.id}/")
+    assert r.status_code == 200
+    etag = r["ETag"]
+    assert c.get(f"/api/bank/spos/{spo.id}/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # a 304 is decided before the assessment rows are read
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    with CaptureQueriesContext(connection) as ctx:
+        assert c.get(f"/api/bank/spos/{spo.id}/", HTTP_IF_NONE_MATCH=f'"other", {etag}').status_code == 304
+    assert not [q for q in ctx.captured_queries if '"scores"' in q["sql"]]
+
+    # re-scoring stamps evaluated_at
+    LoanEligibilityResult.objects.filter(assessment__organization=spo.organization).update(
+        is_eligible=False, evaluated_at=timezone.now(),
+    )
+    r = c.get(f"/api/bank/spos/{spo.id}/", HTTP_IF_NONE_MATCH=etag)
+    assert r.status_code == 200
+    assert r.json()["assessments"][0]["eligibility_decision"] is False
+
+
+@pytest.mark.django_db
+def test_bank_spo_list_empty_pages_keep_total():
+    bank = User.objects.create_user(email="bank@x.com", password="Pass123!", role=User.Role.BANK_USER)
+    c = APIClient()
+    c.force_authenticate(user=bank)
+    _make_eligible_spo(0)
+
+    assert c.get("/api/bank/spos/?limit=0").json() == {"count": 1, "next_cursor": None, "results": []}
+    assert c.get("/api/bank/spos/?offset=10").json() == {"count": 1, "next_cursor": None, "results": []}
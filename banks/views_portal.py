@@ -1,9 +1,14 @@
 # banks/views_portal.py
-from django.db.models import Max
+import hashlib
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, OuterRef, Subquery, Window
 from django.shortcuts import get_object_or_404
-from django.template.loader import render_to_string
-from django.http import HttpResponse
-from django.utils import timezone
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.db.models import Q
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -17,20 +22,46 @@ from accounts.models import User
 from assessments.models import Assessment
 from questionnaires.models import LoanEligibilityResult, LoanRequest
 
+from banks.cache import SPO_LIST_TTL, spo_list_cache_key
 from banks.permissions import IsBankUser
+from banks.reports import (
+    spo_report_context, spo_report_fingerprint, cached_spo_report_pdf,
+)
+from banks.tasks import enqueue_spo_report, get_spo_report_job, wait_for_spo_report_job
 from banks.serializers import (
-    BankSPOListItemSerializer, BankSPODetailSerializer, BankSPODetailAssessmentSerializer
+    BankSPOListItemSerializer, BankSPODetailSerializer,
+    BankSPORow, BankSPOAssessmentRow,
 )
 
+
+def _dump_json(payload) -> bytes:
+    # orjson serializes the row dataclasses natively; OPT_UTC_Z keeps DRF's "...Z" datetimes
+    return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+
+def _json_response(payload):
+    body = payload if isinstance(payload, bytes) else _dump_json(payload)
+    return HttpResponse(body, content_type="application/json")
+
 class BankSPOViewSet(viewsets.ViewSet):
     """
     BANK_USER visibility: **all SPOs system-wide**
     """
     permission_classes = [IsBankUser]
 
+    # columns read by retrieve/report/report jobs for the SPO header + organization block
+    SPO_HEADER_FIELDS = (
+        "id", "email", "first_name", "last_name", "is_active", "date_joined", "role",
+        "organization__id", "organization__created_by", "organization__name",
+        "organization__registration_type", "organization__focus_sector",
+        "organization__cin_number", "organization__updated_at",
+    )
+
     def _base_qs(self):
         return User.objects.filter(role=User.Role.SPO).select_related("organization")
 
+    def _spo_qs(self):
+        return User.objects.select_related("organization").only(*self.SPO_HEADER_FIELDS)
+
     # ---------------------- LIST ----------------------
     @extend_schema(
         tags=["Bank • SPOs"],
@@ -54,7 +85,9 @@ class BankSPOViewSet(viewsets.ViewSet):
             "- `is_active`: true/false\n"
             "- `joined_from`, `joined_to`: ISO datetime\n"
             "- `ordering`: `id` | `-id` (default `-id`)\n"
-            "- `limit`, `offset`: pagination (default limit=50)\n"
+            "- `limit`: page size (default 50)\n"
+            "- `cursor`: keyset pagination; pass the previous page's `next_cursor`\n"
+            "- `offset`: deprecated fallback when no `cursor` is given\n"
         ),
         parameters=[
             OpenApiParameter(name="q", required=False, type=str),
@@ -64,7 +97,8 @@ class BankSPOViewSet(viewsets.ViewSet):
             OpenApiParameter(name="joined_to", required=False, type=str),
             OpenApiParameter(name="ordering", required=False, type=str, description="id or -id"),
             OpenApiParameter(name="limit", required=False, type=int, description="Default 50"),
-            OpenApiParameter(name="offset", required=False, type=int, description="Default 0"),
+            OpenApiParameter(name="cursor", required=False, type=int, description="next_cursor from the previous page"),
+            OpenApiParameter(name="offset", required=False, type=int, description="Deprecated, default 0; ignored when cursor is set"),
         ],
         responses={200: BankSPOListItemSerializer(many=True)},
         examples=[
@@ -100,6 +134,11 @@ class BankSPOViewSet(viewsets.ViewSet):
     )
     def list(self, request):
         try:
+            cache_key = spo_list_cache_key(request.query_params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return _json_response(cached)
+
             qs = self._base_qs()
 
             # --- filters ---
@@ -144,10 +183,7 @@ class BankSPOViewSet(viewsets.ViewSet):
             )
             qs = qs.filter(id__in=eligible_spo_ids)
 
-            # total AFTER eligibility + filters
-            total_count = qs.count()
-
-            # --- pagination (limit/offset, default 50) ---
+            # --- pagination (keyset on id via cursor; limit/offset as fallback, default 50) ---
             try:
                 limit = int(request.query_params.get("limit", 50))
             except ValueError:
@@ -156,18 +192,76 @@ class BankSPOViewSet(viewsets.ViewSet):
                 offset = int(request.query_params.get("offset", 0))
             except ValueError:
                 offset = 0
+            try:
+                cursor = int(request.query_params["cursor"])
+            except (KeyError, ValueError):
+                cursor = None
+            offset = max(offset, 0)
+
+            if limit <= 0:
+                # nothing to page: only the total is needed
+                body = _dump_json({"count": qs.count(), "next_cursor": None, "results": []})
+                cache.set(cache_key, body, SPO_LIST_TTL)
+                return _json_response(body)
+
+            page_qs = qs
+            if cursor is not None:
+                # range scan on the pk index instead of scanning + discarding offset rows
+                page_qs = qs.filter(id__lt=cursor) if ordering == "-id" else qs.filter(id__gt=cursor)
+                offset = 0
 
-            ids = list(qs.values_list("id", flat=True)[offset:offset + limit])
+            # one query for the page: flat .values() rows (no model instances) with the
+            # summary timestamps as correlated MAX subqueries
+            last_assessment_sq = (
+                Assessment.objects
+                    .filter(organization_id=OuterRef("organization__id"), status="SUBMITTED")
+                    .order_by()
+                    .values("organization_id")
+                    .annotate(last_submitted=Max("submitted_at"))
+                    .values("last_submitted")
+            )
+            last_lr_sq = (
+                LoanRequest.objects
+                    .filter(organization_id=OuterRef("organization__id"))
+                    .order_by()
+                    .values("organization_id")
+                    .annotate(last_lr=Max("submitted_at"))
+                    .values("last_lr")
+            )
+            annotations = {
+                "last_assessment_submitted_at": Subquery(last_assessment_sq[:1]),
+                "last_loan_request_submitted_at": Subquery(last_lr_sq[:1]),
+            }
+            fields = [
+                "id", "email", "first_name", "last_name", "is_active", "date_joined",
+                "organization__name", "organization__focus_sector", "organization__created_at",
+                "last_assessment_submitted_at", "last_loan_request_submitted_at",
+            ]
+            if cursor is None:
+                # the filtered total rides along on every page row (window runs before LIMIT)
+                annotations["total_count"] = Window(expression=Count("id"))
+                fields.append("total_count")
+            page_rows = list(page_qs.annotate(**annotations).values(*fields)[offset:offset + limit])
+
+            # total AFTER eligibility + filters (a cursor narrows page_qs, so count qs then)
+            if cursor is None:
+                total_count = page_rows[0]["total_count"] if page_rows else (qs.count() if offset else 0)
+            else:
+                total_count = qs.count()
+            ids = [r["id"] for r in page_rows]
+            next_cursor = ids[-1] if len(ids) == limit else None
             if not ids:
-                return Response({"count": total_count, "results": []})
+                # empty page: skip the eligibility lookup entirely
+                body = _dump_json({"count": total_count, "next_cursor": None, "results": []})
+                cache.set(cache_key, body, SPO_LIST_TTL)
+                return _json_response(body)
 
             # --- latest eligible instrument + scores per SPO on this page ---
             inst_map = {}
             scores_map = {}
 
-            elig_qs = (
+            elig_rows = (
                 LoanEligibilityResult.objects
-                    .select_related("matched_instrument", "assessment__organization__created_by")
                     .filter(
                         is_eligible=True,
                         assessment__organization__created_by_id__in=ids,
@@ -177,34 +271,33 @@ class BankSPOViewSet(viewsets.ViewSet):
                         "-assessment__submitted_at",
                         "-assessment__started_at",
                     )
+                    .values(
+                        "assessment__organization__created_by_id", "overall_score", "details",
+                        "matched_instrument_id", "matched_instrument__name", "matched_instrument__description",
+                    )
             )
 
-            for elig in elig_qs:
-                org = getattr(elig.assessment, "organization", None)
-                if not org:
-                    continue
-                spo_id = org.created_by_id
+            for elig in elig_rows:
+                spo_id = elig["assessment__organization__created_by_id"]
                 if spo_id in inst_map:
                     # already captured the latest for this SPO
                     continue
 
-                inst = elig.matched_instrument
-                if inst:
-                    inst_map[spo_id] = {
-                        "id": inst.id,
-                        "name": inst.name,
-                        "description": inst.description,
-                    }
-                else:
-                    inst_map[spo_id] = None
+                inst_id = elig["matched_instrument_id"]
+                inst_map[spo_id] = {
+                    "id": inst_id,
+                    "name": elig["matched_instrument__name"],
+                    "description": elig["matched_instrument__description"],
+                } if inst_id else None
 
-                sec_details = (elig.details or {}).get("sections", {}) if elig.details else {}
+                sec_details = (elig["details"] or {}).get("sections") or {}
                 impact_norm = (sec_details.get("IMPACT") or {}).get("normalized")
                 risk_norm = (sec_details.get("RISK") or {}).get("normalized")
                 return_norm = (sec_details.get("RETURN") or {}).get("normalized")
+                overall = elig["overall_score"]
 
                 scores_map[spo_id] = {
-                    "overall": float(elig.overall_score) if elig.overall_score is not None else None,
+                    "overall": float(overall) if overall is not None else None,
                     "sections": {
                         "IMPACT": impact_norm,
                         "RISK": risk_norm,
@@ -212,47 +305,29 @@ class BankSPOViewSet(viewsets.ViewSet):
                     },
                 }
 
-            # prefetch summary timestamps
-            submitted_by_user = (
-                Assessment.objects
-                    .filter(organization__created_by_id__in=ids, status="SUBMITTED")
-                    .values("organization__created_by_id")
-                    .annotate(last_submitted=Max("submitted_at"))
-            )
-            last_a_map = {x["organization__created_by_id"]: x["last_submitted"] for x in submitted_by_user}
-
-            last_lr = (
-                LoanRequest.objects
-                    .filter(organization__created_by_id__in=ids)
-                    .values("organization__created_by_id")
-                    .annotate(last_lr=Max("submitted_at"))
-            )
-            last_lr_map = {x["organization__created_by_id"]: x["last_lr"] for x in last_lr}
 
             rows = []
-            for u in User.objects.filter(id__in=ids).select_related("organization"):
-                org = getattr(u, "organization", None)
-                spo_id = u.id
-                rows.append({
-                    "id": u.id,
-                    "email": u.email,
-                    "first_name": u.first_name,
-                    "last_name": u.last_name,
-                    "is_active": u.is_active,
-                    "date_joined": u.date_joined,
-                    "organization_name": getattr(org, "name", "") or "",
-                    "focus_sector": getattr(org, "focus_sector", "") or "",
-                    "org_created_at": getattr(org, "created_at", None) if hasattr(org, "created_at") else None,
-                    "last_assessment_submitted_at": last_a_map.get(spo_id),
-                    "last_loan_request_submitted_at": last_lr_map.get(spo_id),
-                    "instrument": inst_map.get(spo_id),
-                    "scores": scores_map.get(spo_id),
-                })
-
-            return Response({
-                "count": total_count,
-                "results": BankSPOListItemSerializer(rows, many=True).data
-            })
+            for r in page_rows:
+                spo_id = r["id"]
+                rows.append(BankSPORow(
+                    id=spo_id,
+                    email=r["email"],
+                    first_name=r["first_name"],
+                    last_name=r["last_name"],
+                    is_active=r["is_active"],
+                    date_joined=r["date_joined"],
+                    organization_name=r["organization__name"] or "",
+                    focus_sector=r["organization__focus_sector"] or "",
+                    org_created_at=r["organization__created_at"],
+                    last_assessment_submitted_at=r["last_assessment_submitted_at"],
+                    last_loan_request_submitted_at=r["last_loan_request_submitted_at"],
+                    instrument=inst_map.get(spo_id),
+                    scores=scores_map.get(spo_id),
+                ))
+
+            body = _dump_json({"count": total_count, "next_cursor": next_cursor, "results": rows})
+            cache.set(cache_key, body, SPO_LIST_TTL)
+            return _json_response(body)
         except Exception as e:
             return Response(
                 {
@@ -262,6 +337,28 @@ class BankSPOViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _detail_etag(self, spo, org) -> str:
+        # rows are added (count, max id) or rewritten with a fresh timestamp
+        # (submit, re-scoring, loan request edits, org auto_now), so this moves with the body
+        stamps = (
+            Assessment.objects
+                .filter(organization=org)
+                .aggregate(
+                    n=Count("id", distinct=True),
+                    started=Max("started_at"),
+                    submitted=Max("submitted_at"),
+                    evaluated=Max("loan_eligibility__evaluated_at"),
+                    last_lr=Max("loan_requests__id"),
+                    lr_updated=Max("loan_requests__updated_at"),
+                )
+        ) if org else None
+        data = [
+            spo.id, spo.email, spo.first_name, spo.last_name, spo.is_active, spo.date_joined,
+            org.updated_at if org else None,
+            stamps,
+        ]
+        return f'"{hashlib.blake2b(orjson.dumps(data, default=str), digest_size=16).hexdigest()}"'
+
     # ---------------------- RETRIEVE ----------------------
     @extend_schema(
         tags=["Bank • SPOs"],
@@ -269,9 +366,10 @@ class BankSPOViewSet(viewsets.ViewSet):
         summary="SPO detail (organization + assessments)",
         description=(
             "Detail page for a single SPO user id. Includes Organization info and assessments. "
-            "Each assessment is merged with its latest eligibility snapshot and latest loan request id (if present)."
+            "Each assessment is merged with its latest eligibility snapshot and latest loan request id (if present). "
+            "Responses carry an `ETag`; send it back as `If-None-Match` to get `304` when nothing changed."
         ),
-        responses={200: BankSPODetailSerializer, 404: OpenApiResponse(description="Not found")},
+        responses={200: BankSPODetailSerializer, 304: OpenApiResponse(description="Not modified"), 404: OpenApiResponse(description="Not found")},
         examples=[
             OpenApiExample(
                 "Detail example (trimmed)",
@@ -303,35 +401,55 @@ class BankSPOViewSet(viewsets.ViewSet):
     )
     def retrieve(self, request, pk=None):
         try:
-            spo = get_object_or_404(User.objects.select_related("organization"), pk=pk, role=User.Role.SPO)
+            spo = get_object_or_404(self._spo_qs(), pk=pk, role=User.Role.SPO)
             org = getattr(spo, "organization", None)
 
-            # all assessments under this organization
-            assessments = Assessment.objects.filter(organization=org).order_by("-submitted_at", "-started_at")
-            # pre-map eligibilities and latest loan request per assessment
-            elig_map = {
-                e.assessment_id: e for e in LoanEligibilityResult.objects.filter(assessment__in=assessments)
-            }
-            lr_map = (
-                LoanRequest.objects.filter(assessment__in=assessments)
-                .values("assessment_id").annotate(last_lr_id=Max("id"))
+            # cheap validator first: one aggregate over the timestamps behind the body,
+            # so an unchanged SPO gets its 304 before the assessment rows are read
+            etag = self._detail_etag(spo, org)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+            # all assessments under this organization, with their eligibility
+            # snapshot and the latest loan request id
+            last_lr_id_sq = (
+                LoanRequest.objects
+                    .filter(assessment_id=OuterRef("pk"))
+                    .order_by()
+                    .values("assessment_id")
+                    .annotate(last_lr_id=Max("id"))
+                    .values("last_lr_id")
+            )
+            # flat rows (eligibility columns LEFT JOINed in), no model hydration
+            assessments = (
+                Assessment.objects
+                    .filter(organization=org)
+                    .annotate(last_lr_id=Subquery(last_lr_id_sq[:1]))
+                    .order_by("-submitted_at", "-started_at")
+                    .values(
+                        "id", "status", "started_at", "submitted_at", "scores", "last_lr_id",
+                        "loan_eligibility__overall_score",
+                        "loan_eligibility__is_eligible",
+                        "loan_eligibility__details__reason",
+                    )
             )
-            lr_by_assessment = {row["assessment_id"]: row["last_lr_id"] for row in lr_map}
 
             items = []
             for a in assessments:
-                elig = elig_map.get(a.id)
-                items.append({
-                    "id": a.id,
-                    "status": a.status,
-                    "started_at": a.started_at,
-                    "submitted_at": a.submitted_at,
-                    "scores": a.scores or {},
-                    "eligibility_overall": float(elig.overall_score) if elig else None,
-                    "eligibility_decision": bool(elig.is_eligible) if elig else None,
-                    "eligibility_reason": (elig.details or {}).get("reason") if elig else None,
-                    "loan_request_id": lr_by_assessment.get(a.id),
-                })
+                has_elig = a["loan_eligibility__overall_score"] is not None
+                reason = a["loan_eligibility__details__reason"]
+                items.append(BankSPOAssessmentRow(
+                    id=a["id"],
+                    status=a["status"],
+                    started_at=a["started_at"],
+                    submitted_at=a["submitted_at"],
+                    scores=a["scores"] or {},
+                    eligibility_overall=float(a["loan_eligibility__overall_score"]) if has_elig else None,
+                    eligibility_decision=bool(a["loan_eligibility__is_eligible"]) if has_elig else None,
+                    eligibility_reason=str(reason) if reason is not None else None,
+                    loan_request_id=a["last_lr_id"],
+                ))
 
             payload = {
                 "spo": {
@@ -349,10 +467,12 @@ class BankSPOViewSet(viewsets.ViewSet):
                     "focus_sector": getattr(org, "focus_sector", "") if org else "",
                     "poc_email": spo.email,
                 },
-                "assessments": BankSPODetailAssessmentSerializer(items, many=True).data,
+                "assessments": items,
                 "email_placeholder": "",
             }
-            return Response(payload)
+            resp = _json_response(payload)
+            resp["ETag"] = etag
+            return resp
         except Exception as e:
             return Response(
                 {"message": "We could not fetch the SPO details right now. Please try again later.", "errors": str(e)},
@@ -364,48 +484,148 @@ class BankSPOViewSet(viewsets.ViewSet):
         tags=["Bank • SPOs"],
         operation_id="bank_spo_report_pdf",
         summary="Download SPO report (PDF) for Bank",
-        description="Bank-scoped PDF with SPO, Organization, Assessment scores & eligibility.",
-        responses={200: OpenApiResponse(description="PDF binary")},
+        description=(
+            "Bank-scoped PDF with SPO, Organization, Assessment scores & eligibility. "
+            "Responses carry an `ETag`; send it back as `If-None-Match` to get `304` when nothing changed. "
+            "If the PDF is still being rendered the response is `202` with a `status_url` to poll, "
+            "as for the report job endpoints."
+        ),
+        responses={
+            200: OpenApiResponse(description="PDF binary"),
+            202: OpenApiResponse(description="Accepted, render queued"),
+            304: OpenApiResponse(description="Not modified"),
+        },
     )
     @action(detail=True, methods=["get"], url_path="report")
     def report(self, request, pk=None):
         try:
-            spo = get_object_or_404(User.objects.select_related("organization"), pk=pk, role=User.Role.SPO)
-            org = getattr(spo, "organization", None)
-            assessments = Assessment.objects.filter(organization=org).order_by("-submitted_at", "-started_at")
+            spo = get_object_or_404(self._spo_qs(), pk=pk, role=User.Role.SPO)
+            ctx = spo_report_context(spo)
+            fingerprint = spo_report_fingerprint(ctx)
+            etag = f'"{fingerprint}"'
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+            # unchanged report data -> reuse the rendered PDF instead of re-running WeasyPrint;
+            # otherwise queue (or join) the render on the report pool rather than rendering on
+            # the request thread, and give it a short while before handing back the job
+            pdf_path = cached_spo_report_pdf(fingerprint)
+            if pdf_path is None:
+                job_id, job = enqueue_spo_report(spo, ctx=ctx, fingerprint=fingerprint)
+                job = wait_for_spo_report_job(job_id, settings.BANK_REPORT_SYNC_WAIT) or job
+                if job["state"] == "FAILED":
+                    raise RuntimeError(job.get("error") or "report render failed")
+                pdf_path = cached_spo_report_pdf(fingerprint) if job["state"] == "READY" else None
+                if pdf_path is None:
+                    return Response(
+                        {
+                            "job_id": job_id,
+                            "state": job["state"],
+                            "status_url": reverse("bank-spos-report-job-status", kwargs={"job_id": job_id}),
+                        },
+                        status=status.HTTP_202_ACCEPTED,
+                    )
 
-            # prebuild list merged with elig
-            elig_map = {e.assessment_id: e for e in LoanEligibilityResult.objects.filter(assessment__in=assessments)}
-            rows = []
-            for a in assessments:
-                e = elig_map.get(a.id)
-                rows.append({
-                    "id": a.id,
-                    "status": a.status,
-                    "started_at": a.started_at,
-                    "submitted_at": a.submitted_at,
-                    "scores": a.scores or {},
-                    "eligibility": {
-                        "overall": float(e.overall_score) if e else None,
-                        "decision": bool(e.is_eligible) if e else None,
-                        "reason": (e.details or {}).get("reason") if e else None,
-                    }
-                })
-
-            html = render_to_string("bank_portal/spo_report.html", {
-                "generated_at": timezone.now(),
-                "spo": spo,
-                "org": org,
-                "assessments": rows,
-            })
-            from weasyprint import HTML as WEASY_HTML
-            pdf_bytes = WEASY_HTML(string=html).write_pdf()
-
-            resp = HttpResponse(pdf_bytes, content_type="application/pdf")
-            resp["Content-Disposition"] = f'attachment; filename="bank-spo-{spo.id}.pdf"'
+            resp = FileResponse(
+                open(pdf_path, "rb"),
+                content_type="application/pdf",
+                as_attachment=True,
+                filename=f"bank-spo-{spo.id}.pdf",
+            )
+            resp["ETag"] = etag
             return resp
         except Exception as e:
             return Response(
                 {"message": "We could not generate the SPO report right now. Please try again later.", "errors": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
\ No newline at end of file
+            )
+
+    # ---------------------- REPORT (background job) ----------------------
+    @extend_schema(
+        tags=["Bank • SPOs"],
+        operation_id="bank_spo_report_job_create",
+        summary="Start SPO report (PDF) generation in the background",
+        description=(
+            "Queues the PDF render and returns immediately with a job id. "
+            "Poll `status_url` until `state` is `READY`, then fetch `download_url`."
+        ),
+        request=None,
+        responses={202: OpenApiResponse(description="Accepted")},
+        examples=[
+            OpenApiExample(
+                "Accepted",
+                value={
+                    "job_id": "3f1c0c6a9e2b4d7f8a5b6c7d8e9f0a1b",
+                    "state": "PENDING",
+                    "status_url": "/api/bank/spos/report-jobs/3f1c0c6a9e2b4d7f8a5b6c7d8e9f0a1b/",
+                },
+                response_only=True,
+            )
+        ],
+    )
+    @action(detail=True, methods=["post"], url_path="report/jobs")
+    def report_job_create(self, request, pk=None):
+        try:
+            spo = get_object_or_404(self._spo_qs(), pk=pk, role=User.Role.SPO)
+            job_id, job = enqueue_spo_report(spo)
+            return Response(
+                {
+                    "job_id": job_id,
+                    "state": job["state"],
+                    "status_url": reverse("bank-spos-report-job-status", kwargs={"job_id": job_id}),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+        except Exception as e:
+            return Response(
+                {"message": "We could not start the SPO report right now. Please try again later.", "errors": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @extend_schema(
+        tags=["Bank • SPOs"],
+        operation_id="bank_spo_report_job_status",
+        summary="SPO report job status",
+        description="`state` is one of `PENDING`, `READY`, `FAILED`. `download_url` is set once `READY`.",
+        responses={200: OpenApiResponse(description="OK"), 404: OpenApiResponse(description="Unknown or expired job")},
+    )
+    @action(detail=False, methods=["get"], url_path=r"report-jobs/(?P<job_id>[0-9a-f]{32})")
+    def report_job_status(self, request, job_id=None):
+        job = get_spo_report_job(job_id)
+        if job is None:
+            return Response({"message": "Report job not found or expired."}, status=status.HTTP_404_NOT_FOUND)
+        data = {"job_id": job_id, "state": job["state"], "spo_id": job["spo_id"]}
+        if job["state"] == "READY":
+            data["download_url"] = reverse("bank-spos-report-job-download", kwargs={"job_id": job_id})
+        elif job["state"] == "FAILED":
+            data["errors"] = job.get("error")
+        return Response(data)
+
+    @extend_schema(
+        tags=["Bank • SPOs"],
+        operation_id="bank_spo_report_job_download",
+        summary="Download a finished SPO report (PDF)",
+        responses={
+            200: OpenApiResponse(description="PDF binary"),
+            404: OpenApiResponse(description="Unknown or expired job"),
+            409: OpenApiResponse(description="Report not ready yet"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path=r"report-jobs/(?P<job_id>[0-9a-f]{32})/download")
+    def report_job_download(self, request, job_id=None):
+        job = get_spo_report_job(job_id)
+        if job is None:
+            return Response({"message": "Report job not found or expired."}, status=status.HTTP_404_NOT_FOUND)
+        if job["state"] != "READY":
+            return Response({"message": "Report is not ready yet.", "state": job["state"]}, status=status.HTTP_409_CONFLICT)
+        pdf_path = cached_spo_report_pdf(job["fingerprint"])
+        if pdf_path is None:
+            return Response({"message": "Report job not found or expired."}, status=status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(
+            open(pdf_path, "rb"),
+            content_type="application/pdf",
+            as_attachment=True,
+            filename=f"bank-spo-{job['spo_id']}.pdf",
+        )
@@ -0,0 +1,18 @@
+# config/encoders.py
+import json
+
+import orjson
+
+# JSONField encoder/decoder pair backed by orjson. Django and DRF call these
+# through json.dumps(cls=...) / json.loads(cls=...), so only encode()/decode()
+# are swapped; unsupported types still raise TypeError via JSONEncoder.default.
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    def encode(self, o):
+        return orjson.dumps(o, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    def decode(self, s, *args, **kwargs):
+        return orjson.loads(s)
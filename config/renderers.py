@@ -0,0 +1,21 @@
+# config/renderers.py
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson handles dict/list/str/datetime/UUID natively; anything else (Decimal,
+# lazy strings, querysets, ...) goes through DRF's own encoder, so payloads
+# render the same as with the stock JSONRenderer.
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer backed by orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_drf_default, option=option)
@@ -0,0 +1,17 @@
+# config/serializers.py
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    DRF serializer mixin: build the field map once per class and hand each
+    instance shallow copies, instead of re-running get_fields() every time.
+    Only use it on serializers whose fields don't depend on init kwargs/context.
+    """
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {name: copy.copy(field) for name, field in cached.items()}
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 import os
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -59,9 +60,13 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.JWTAuthenticationWithRelated",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
 SIMPLE_JWT = {
@@ -126,7 +131,11 @@ DATABASES = {
         "NAME": os.getenv("DB_NAME", "villgro"),
         "USER": os.getenv("DB_USER", "villgro"),
         "PASSWORD": os.getenv("DB_PASSWORD", ""),
-        "CONN_MAX_AGE": 60,
+        # keep connections open across requests; health-check them before reuse
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        # required when DB_HOST points at PgBouncer in transaction pooling mode
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv("DB_DISABLE_SERVER_SIDE_CURSORS", "False").lower() in ("1", "true", "yes"),
     }
 }
 
@@ -176,6 +185,32 @@ STATIC_URL = "/django-static/"
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cached responses are invalidated by version stamps that every gunicorn worker
+# (and the management commands) must see, so the cache has to be shared:
+# Redis when REDIS_URL is set, else a table in Postgres (`manage.py createcachetable`).
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+
+# rendered bank SPO report PDFs (served with FileResponse, pruned after an hour)
+BANK_REPORT_DIR = Path(os.getenv("BANK_REPORT_DIR", Path(tempfile.gettempdir()) / "villgro-bank-reports"))
+# WeasyPrint is CPU-bound: keep the per-process render pool small, since every gunicorn worker has one
+BANK_REPORT_WORKERS = int(os.getenv("BANK_REPORT_WORKERS", "1"))
+# how long GET .../report waits for a queued render before answering 202 with the job to poll
+BANK_REPORT_SYNC_WAIT = float(os.getenv("BANK_REPORT_SYNC_WAIT", "5"))
+
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND")
 EMAIL_HOST = os.getenv("EMAIL_HOST")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
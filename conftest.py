@@ -3,6 +3,8 @@ from accounts.models import User
 from django.core.management import call_command
 from pathlib import Path
 from rest_framework.test import APIClient
+from django.conf import settings
+from django.core.cache import cache
 from organizations.models import Organization 
 from django.db.models.signals import post_save, post_delete, pre_save, m2m_changed
 from admin_portal import signals as audit_signals
@@ -13,13 +15,22 @@ def user(db):
     return User.objects.create_user(username="tester", password="pass1234")
 
 @pytest.fixture(scope="session", autouse=True)
-def seed_questionnaire_db(django_db_setup, django_db_blocker):
-    # Ensure DB is ready, then seed from JSON
+def seeded_questionnaire(django_db_setup, django_db_blocker):
+    # Seed from JSON once per session, for every test: the rows are committed
+    # outside the test transactions, so whether they exist must not depend on
+    # which tests ran first. The seed upserts by code, so a database kept with --reuse-db is fine.
     json_path = Path("seed/questionnaire_v1.json")
     with django_db_blocker.unblock():
         call_command("seed_questionnaire", "--file", str(json_path))
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # the test DB rolls back without firing signals, so drop cached responses between tests
+    cache.clear()
+    yield
+
+
 @pytest.fixture
 def api_client(user_with_org):
     client = APIClient()
@@ -57,15 +68,18 @@ def _connect():
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "audit_signals: enable audit audit signals for this test")
+    # every test creates users; the production hasher is deliberately slow
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    # tests run in one process, so the shared cache backend buys nothing here
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    # audit logging is off for the whole session; marked tests switch it on
+    _disconnect()
 
 @pytest.fixture(autouse=True)
 def control_audit_signals(request):
-    want = request.node.get_closest_marker("audit_signals") is not None
-    if want:
-        _connect()
-        yield
-        _disconnect()
-    else:
-        _disconnect()
+    if request.node.get_closest_marker("audit_signals") is None:
         yield
-        _connect()
\ No newline at end of file
+        return
+    _connect()
+    yield
+    _disconnect()
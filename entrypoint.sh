@@ -12,4 +12,5 @@ echo "Database is up!"
 
 # python manage.py makemigrations --noinput
 # python manage.py migrate --noinput
+python manage.py createcachetable
 exec gunicorn config.wsgi:application --bind 0.0.0.0:8000 --workers 2 --timeout 300
\ No newline at end of file
@@ -95,22 +95,44 @@ def notify_email(
         logger.exception("Email send failed: event=%s to=%s", event, list(to))
         return False
     
+def spo_abandoned_context(*, spo, org, assessment, recorded_at) -> dict:
+    """
+    Plain-data template context for the abandoned notice. Built on the request
+    thread from already-loaded objects, so rendering never touches the ORM.
+    """
+    return {
+        "spo": {"email": spo.email, "first_name": spo.first_name},
+        "org": {"name": org.name},
+        "assessment": {"id": assessment.id},
+        "recorded_at": recorded_at,
+    }
+
 def send_spo_abandoned_email(*, spo, org, assessment, recorded_at) -> bool:
     """
     Sends a single email to the SPO notifying them that progress was saved
     and they can resume the assessment.
     Returns True if Django reports a successful send (>=1), else False.
     """
-    if not getattr(spo, "email", None):
-        logger.warning("SPO has no email; skipping abandoned notice. assessment=%s", assessment.id)
-        return False
+    return send_spo_abandoned_email_from_context(
+        spo_abandoned_context(spo=spo, org=org, assessment=assessment, recorded_at=recorded_at)
+    )
 
-    ctx = {
-        "spo": spo,
-        "org": org,
-        "assessment": assessment,
-        "recorded_at": recorded_at,
-    }
+def send_spo_abandoned_email_from_context(
+    ctx: Mapping[str, Any],
+    *,
+    connection=None,
+    raise_errors: bool = False,
+) -> bool:
+    """
+    Same as send_spo_abandoned_email(), from a spo_abandoned_context() dict.
+    Pass `connection` (django.core.mail.get_connection()) to reuse one SMTP
+    session across a batch; `raise_errors` lets a caller retry failed sends.
+    """
+    spo_email = ctx["spo"].get("email")
+    assessment_id = ctx["assessment"]["id"]
+    if not spo_email:
+        logger.warning("SPO has no email; skipping abandoned notice. assessment=%s", assessment_id)
+        return False
 
     subject = render_to_string("emails/spo_abandoned_subject.txt", ctx).strip()
     body_txt = render_to_string("emails/spo_abandoned.txt", ctx)
@@ -120,14 +142,17 @@ def send_spo_abandoned_email(*, spo, org, assessment, recorded_at) -> bool:
         subject=subject,
         body=body_txt,
         from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-        to=[spo.email],
+        to=[spo_email],
+        connection=connection,
     )
     email.attach_alternative(body_html, "text/html")
 
     try:
         sent = email.send()
-        logger.info("Sent SPO abandoned email to %s for assessment=%s (sent=%s)", spo.email, assessment.id, sent)
+        logger.info("Sent SPO abandoned email to %s for assessment=%s (sent=%s)", spo_email, assessment_id, sent)
         return bool(sent)
     except Exception:
-        logger.exception("Failed to send SPO abandoned email for assessment=%s", assessment.id)
-        return False
\ No newline at end of file
+        if raise_errors:
+            raise
+        logger.exception("Failed to send SPO abandoned email for assessment=%s", assessment_id)
+        return False
@@ -0,0 +1,58 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from smtplib import SMTPException
+
+from django.db import connections
+
+from notifications.email import send_spo_abandoned_email_from_context
+
+logger = logging.getLogger("notifications")
+
+# No task broker is deployed, so outbound mail runs on a small in-process pool.
+# Created lazily so every gunicorn worker gets its own pool after fork.
+# transient relay/network errors are retried with exponential backoff (2s, 4s)
+SEND_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 2
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notifications")
+    return _executor
+
+
+def _run_spo_abandoned_email(ctx):
+    try:
+        for attempt in range(1, SEND_ATTEMPTS + 1):
+            try:
+                send_spo_abandoned_email_from_context(ctx, raise_errors=True)
+                return
+            except (SMTPException, OSError):
+                if attempt == SEND_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "SPO abandoned email attempt %s failed for assessment=%s; retrying",
+                    attempt, ctx["assessment"]["id"],
+                )
+                time.sleep(RETRY_BACKOFF_SECONDS ** attempt)
+    except Exception:
+        logger.exception("Failed to send SPO abandoned email for assessment=%s", ctx["assessment"]["id"])
+    finally:
+        connections.close_all()
+
+
+def send_spo_abandoned_email_async(ctx):
+    """
+    Queue send_spo_abandoned_email_from_context() off the request thread.
+    `ctx` is a spo_abandoned_context() dict, so the worker needs no ORM access.
+    Call it from transaction.on_commit() so nothing is sent for rolled-back writes.
+    """
+    return _get_executor().submit(_run_spo_abandoned_email, ctx)
@@ -0,0 +1,32 @@
+# organizations/cache.py
+from django.core.cache import cache
+
+from questionnaires.models import Question
+
+# Focus sectors come from the questionnaire and change only when an admin edits
+# questions; the Question signal in organizations/signals.py drops the key.
+FOCUS_SECTORS_KEY = "meta:sectors"
+FOCUS_SECTORS_TTL = 3600
+# the rendered /api/meta/options body embeds the sectors, so it shares their lifetime
+META_OPTIONS_BODY_KEY = "meta:options:body"
+
+
+def _load_focus_sectors():
+    # order_by() drops Meta.ordering, which would otherwise leak into the DISTINCT;
+    # the filter matches the partial q_sector_idx
+    sectors = (
+        Question.objects
+            .exclude(sector__isnull=True).exclude(sector="")
+            .order_by()
+            .values_list("sector", flat=True)
+            .distinct()
+    )
+    return [{"label": sec, "value": sec} for sec in sectors]
+
+
+def focus_sectors():
+    return cache.get_or_set(FOCUS_SECTORS_KEY, _load_focus_sectors, FOCUS_SECTORS_TTL)
+
+
+def invalidate_focus_sectors():
+    cache.delete_many([FOCUS_SECTORS_KEY, META_OPTIONS_BODY_KEY])
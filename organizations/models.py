@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField  # Postgres
+from config.encoders import ORJSONDecoder, ORJSONEncoder
 
 class Organization(models.Model):
     class RegistrationType(models.TextChoices):
@@ -65,6 +66,11 @@ class Organization(models.Model):
     use_of_questionnaire = models.CharField(max_length=10, choices=UseOfQuestionnaire.choices, null=True, blank=True)
     received_philanthropy_before = models.BooleanField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["focus_sector"]),
+        ]
+
     
 class OnboardingProgress(models.Model):
     user = models.OneToOneField(
@@ -75,7 +81,7 @@ class OnboardingProgress(models.Model):
     # 1..3 for now
     current_step = models.PositiveSmallIntegerField(default=1)
     # arbitrary JSON to stash partial UI state/payloads (drafts)
-    data = models.JSONField(default=dict, blank=True)
+    data = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder)
     is_complete = models.BooleanField(default=False)
     updated_at = models.DateTimeField(auto_now=True)
 
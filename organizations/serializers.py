@@ -1,14 +1,21 @@
+from django.db import transaction
+from django.db.models import F, JSONField, Value
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Greatest
+from django.utils import timezone
 from rest_framework import serializers
 from organizations.models import OnboardingProgress, Organization
-from questionnaires.models import Question
+from organizations.cache import focus_sectors
+from config.serializers import CachedFieldsMixin
 
-class OnboardingProgressSerializer(serializers.ModelSerializer):
+class OnboardingProgressSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     sectors = serializers.SerializerMethodField()
 
     class Meta:
         model = OnboardingProgress
         fields = ["current_step", "data", "is_complete", "updated_at", "sectors"]
-        read_only_fields = ["is_complete", "updated_at"]
+        # output-only (the save path uses OnboardingProgressSaveSerializer)
+        read_only_fields = fields
 
     def get_sectors(self, obj: OnboardingProgress):
         """
@@ -19,39 +26,35 @@ class OnboardingProgressSerializer(serializers.ModelSerializer):
             ...
         ]
         """
-        sectors = Question.objects \
-            .values_list("sector", flat=True) \
-            .distinct()
-        
-        sectors = set(sectors)
+        return focus_sectors()
 
-        return [
-            {"label": sec, "value": sec}
-            for sec in sectors if sec
-        ]
-
-class OnboardingProgressSaveSerializer(serializers.Serializer):
+class OnboardingProgressSaveSerializer(CachedFieldsMixin, serializers.Serializer):
     # Save/merge partial data and/or move the pointer
     current_step = serializers.IntegerField(min_value=1, required=False)
     data = serializers.DictField(required=False)
 
     def update(self, instance: OnboardingProgress, validated_data):
-        # merge data shallowly; FE can send full or partial keys
+        # merge data shallowly; FE can send full or partial keys.
+        # One UPDATE: Postgres merges the blob (jsonb ||) and the step only moves forward.
+        updates = {"updated_at": timezone.now()}
         new_data = validated_data.get("data")
         if new_data:
-            merged = {**(instance.data or {}), **new_data}
-            instance.data = merged
+            updates["data"] = CombinedExpression(
+                F("data"), "||", Value(new_data, output_field=JSONField()), output_field=JSONField(),
+            )
+            instance.data = {**(instance.data or {}), **new_data}
         if "current_step" in validated_data:
-            step = validated_data["current_step"]
-            instance.bump_to(step)
-        instance.save()
+            instance.bump_to(validated_data["current_step"])
+            updates["current_step"] = Greatest(F("current_step"), Value(instance.current_step))
+        OnboardingProgress.objects.filter(pk=instance.pk).update(**updates)
+        instance.updated_at = updates["updated_at"]
         return instance
 
-class OnboardingAdvanceSerializer(serializers.Serializer):
+class OnboardingAdvanceSerializer(CachedFieldsMixin, serializers.Serializer):
     # Optional: explicitly advance to a given step
     to_step = serializers.IntegerField(min_value=1, max_value=3)
 
-class Step2Serializer(serializers.Serializer):
+class Step2Serializer(CachedFieldsMixin, serializers.Serializer):
     type_of_innovation = serializers.ChoiceField(choices=Organization.InnovationType.choices)
     geo_scope = serializers.ChoiceField(choices=Organization.GeoScope.choices)
     top_states = serializers.ListField(
@@ -62,27 +65,38 @@ class Step2Serializer(serializers.Serializer):
     def validate_top_states(self, value):
         if len(value) > 5:
             raise serializers.ValidationError("Select up to 5 states.")
-        # Optional: ensure unique, strip blanks
-        cleaned = [s.strip() for s in value if s.strip()]
-        if len(set(cleaned)) != len(cleaned):
-            raise serializers.ValidationError("States must be unique.")
+        # Optional: ensure unique, strip blanks (one pass, stops at the first duplicate)
+        cleaned, seen = [], set()
+        for state in value:
+            state = state.strip()
+            if not state:
+                continue
+            if state in seen:
+                raise serializers.ValidationError("States must be unique.")
+            seen.add(state)
+            cleaned.append(state)
         return cleaned
 
     def save(self, **kwargs):
         org: Organization = self.context["organization"]
+        prog: OnboardingProgress = self.context["progress"]
         org.type_of_innovation = self.validated_data["type_of_innovation"]
         org.geo_scope = self.validated_data["geo_scope"]
         org.top_states = self.validated_data.get("top_states", [])
-        org.save(update_fields=["type_of_innovation", "geo_scope", "top_states"])
-        # progress jump to step 3
-        prog: OnboardingProgress = self.context["progress"]
-        if prog.current_step < 3:
-            prog.current_step = 3
-            prog.save(update_fields=["current_step", "updated_at"])
+        # org + progress writes commit together (one commit instead of two)
+        with transaction.atomic():
+            org.save(update_fields=["type_of_innovation", "geo_scope", "top_states"])
+            # progress jump to step 3: one guarded UPDATE, no read-modify-write
+            if prog.current_step < 3:
+                prog.updated_at = timezone.now()
+                OnboardingProgress.objects.filter(pk=prog.pk, current_step__lt=3).update(
+                    current_step=3, updated_at=prog.updated_at,
+                )
+                prog.current_step = 3
         return org
 
 
-class Step3Serializer(serializers.Serializer):
+class Step3Serializer(CachedFieldsMixin, serializers.Serializer):
     focus_sector = serializers.CharField(max_length=255)
     org_stage = serializers.ChoiceField(choices=Organization.OrgStage.choices)
     impact_focus = serializers.ChoiceField(choices=Organization.ImpactFocus.choices)
@@ -101,7 +115,7 @@ class Step3Serializer(serializers.Serializer):
         return org
 
 
-class FinishSerializer(serializers.Serializer):
+class FinishSerializer(CachedFieldsMixin, serializers.Serializer):
     """No fields; we just validate all required org fields exist, then mark complete."""
     def validate(self, attrs):
         org: Organization = self.context["organization"]
@@ -124,5 +138,8 @@ class FinishSerializer(serializers.Serializer):
         prog: OnboardingProgress = self.context["progress"]
         prog.is_complete = True
         prog.current_step = max(prog.current_step, 3)
-        prog.save(update_fields=["is_complete","current_step","updated_at"])
+        prog.updated_at = timezone.now()
+        OnboardingProgress.objects.filter(pk=prog.pk).update(
+            is_complete=True, current_step=Greatest(F("current_step"), 3), updated_at=prog.updated_at,
+        )
         return prog
\ No newline at end of file
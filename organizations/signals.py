@@ -0,0 +1,11 @@
+# organizations/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from questionnaires.models import Question
+from organizations.cache import invalidate_focus_sectors
+
+
+@receiver([post_save, post_delete], sender=Question)
+def invalidate_meta_sectors(sender, instance, **kwargs):
+    invalidate_focus_sectors()
@@ -20,4 +20,17 @@ def test_meta_options_endpoint():
     assert "key" in body["registration_types"][0] and "label" in body["registration_types"][0]
     # states should be a list and have at least a few entries
     assert isinstance(body["states"], list)
-    assert len(body["states"]) >= 10
\ No newline at end of file
+    assert len(body["states"]) >= 10
+
+
+@pytest.mark.django_db
+def test_meta_options_sectors_refresh_on_question_save():
+    from questionnaires.models import Question, Section
+
+    client = APIClient()
+    sec = Section.objects.create(code="META_SEC", title="Meta")
+    client.get("/api/meta/options")  # warm the sectors cache
+
+    Question.objects.create(code="META_Q1", section=sec, text="q", type="RATING", sector="Agritech")
+    body = client.get("/api/meta/options").json()
+    assert {"label": "Agritech", "value": "Agritech"} in body["focus_sectors"]
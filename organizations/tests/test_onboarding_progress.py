@@ -34,4 +34,21 @@ def test_save_and_resume_progress_with_flags():
     # Advance to step 3
     r4 = client.post("/api/onboarding/advance", {"to_step":3}, format="json")
     assert r4.status_code == 200
-    assert r4.data["current_step"] == 3
\ No newline at end of file
+    assert r4.data["current_step"] == 3
+
+
+@pytest.mark.django_db
+def test_get_or_create_progress_is_memoized_on_user(django_assert_num_queries):
+    from organizations.utils import get_or_create_progress
+
+    u = User.objects.create_user(email="memo@example.com", password="StrongPass123!", role=User.Role.SPO)
+    prog = get_or_create_progress(u)
+    with django_assert_num_queries(0):
+        assert get_or_create_progress(u) is prog
+    # a fresh user instance hits the insert, which leaves the existing row alone
+    # (no new row version), and reads it back
+    fresh = User.objects.get(pk=u.pk)
+    with django_assert_num_queries(2):
+        again = get_or_create_progress(fresh)
+    assert again.pk == prog.pk and again.data == {}
+    assert again.updated_at == prog.updated_at
@@ -1,5 +1,25 @@
 from organizations.models import OnboardingProgress
 
+_ONBOARDING = OnboardingProgress._meta.get_field("user").remote_field  # User.onboarding
+
+# create-if-missing without a read-then-insert race; DO NOTHING leaves an existing
+# row untouched (no new row version) and RETURNING then yields nothing, so the
+# caller falls back to a plain SELECT. (Sends no post_save, so no audit entry for the row.)
+_PROGRESS_UPSERT_SQL = f"""
+    INSERT INTO {OnboardingProgress._meta.db_table} (user_id, current_step, data, is_complete, updated_at)
+    VALUES (%s, 1, '{{}}'::jsonb, false, NOW())
+    ON CONFLICT (user_id) DO NOTHING
+    RETURNING id, user_id, current_step, data, is_complete, updated_at
+"""
+
+
 def get_or_create_progress(user):
-    obj, _ = OnboardingProgress.objects.get_or_create(user=user)
-    return obj
\ No newline at end of file
+    # memoized on the user's reverse one-to-one cache: preloaded by
+    # JWTAuthenticationWithRelated, or filled by the first call in a request
+    obj = _ONBOARDING.get_cached_value(user, default=None)
+    if obj is None:
+        # raw() applies the field converters (JSONField) to the RETURNING row
+        created = list(OnboardingProgress.objects.raw(_PROGRESS_UPSERT_SQL, [user.pk]))
+        obj = created[0] if created else OnboardingProgress.objects.get(user_id=user.pk)
+        _ONBOARDING.set_cached_value(user, obj)
+    return obj
@@ -1,10 +1,13 @@
+import orjson
+from django.core.cache import cache
+from django.http import HttpResponse
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiExample
 
-from organizations.models import OnboardingProgress, Organization
+from organizations.models import Organization
 from organizations.serializers import (
     OnboardingProgressSerializer,
     OnboardingProgressSaveSerializer,
@@ -13,7 +16,17 @@ from organizations.serializers import (
 )
 from organizations.utils import get_or_create_progress
 from organizations.constants import INDIA_STATES
-from questionnaires.models import Question
+from organizations.cache import focus_sectors, FOCUS_SECTORS_TTL, META_OPTIONS_BODY_KEY
+
+def _progress_payload(prog):
+    # same shape as OnboardingProgressSerializer (kept for the schema), built directly
+    return {
+        "current_step": prog.current_step,
+        "data": prog.data,
+        "is_complete": prog.is_complete,
+        "updated_at": prog.updated_at,
+        "sectors": focus_sectors(),
+    }
 
 class OnboardingProgressView(APIView):
     permission_classes = [IsAuthenticated]
@@ -28,7 +41,7 @@ class OnboardingProgressView(APIView):
     def get(self, request):
         try:
             prog = get_or_create_progress(request.user)
-            payload = OnboardingProgressSerializer(prog).data
+            payload = _progress_payload(prog)
             payload["has_completed_profile"] = bool(prog.is_complete)
             return Response(payload)
         except Exception as e:
@@ -52,7 +65,7 @@ class OnboardingProgressView(APIView):
             ser = OnboardingProgressSaveSerializer(data=request.data)
             ser.is_valid(raise_exception=True)
             prog = ser.update(prog, ser.validated_data)
-            return Response(OnboardingProgressSerializer(prog).data, status=status.HTTP_200_OK)
+            return Response(_progress_payload(prog), status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
                 {"message": "We could not save the onboarding progress right now. Please try again later.", "errors": str(e)},
@@ -74,7 +87,7 @@ class OnboardingAdvanceView(APIView):
             ser.is_valid(raise_exception=True)
             prog.bump_to(ser.validated_data["to_step"])
             prog.save()
-            return Response(OnboardingProgressSerializer(prog).data)
+            return Response(_progress_payload(prog))
         except Exception as e:
             return Response(
                 {"message": "We could not advance the onboarding progress right now. Please try again later.", "errors": str(e)},
@@ -83,11 +96,9 @@ class OnboardingAdvanceView(APIView):
     
 
 def _get_org_and_progress(user):
-    org = getattr(user, "organization", None)
-    if not org:
-        return None, OnboardingProgress.objects.get_or_create(user=user)[0]
-    prog, _ = OnboardingProgress.objects.get_or_create(user=user)
-    return org, prog
+    # organization/onboarding arrive with the user (JWTAuthenticationWithRelated);
+    # only a first-time onboarding row costs a query here
+    return getattr(user, "organization", None), get_or_create_progress(user)
 
 class OnboardingStep2View(APIView):
     permission_classes = [IsAuthenticated]
@@ -155,37 +166,34 @@ class OnboardingFinishView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
     
+def to_key_label(choices):
+    return tuple({"key": k, "label": v} for k, v in choices)
+
+# choices and states are static, so the bulk of the meta payload is built once;
+# tuples keep the shared arrays from being mutated by a caller
+META_OPTIONS_STATIC = {
+    "registration_types": to_key_label(Organization.RegistrationType.choices),
+    "innovation_types":   to_key_label(Organization.InnovationType.choices),
+    "geo_scopes":         to_key_label(Organization.GeoScope.choices),
+    "stages":             to_key_label(Organization.OrgStage.choices),
+    "impact_focus":       to_key_label(Organization.ImpactFocus.choices),
+    "use_of_questionnaire": to_key_label(Organization.UseOfQuestionnaire.choices),
+    "states": tuple(INDIA_STATES),
+    "top_states_limit": 5,
+}
+
+def _meta_options_body():
+    return orjson.dumps({**META_OPTIONS_STATIC, "focus_sectors": focus_sectors()})
+
 class MetaOptionsView(APIView):
     permission_classes = [AllowAny]  # Public; or use IsAuthenticated if you prefer
 
     @extend_schema(responses={200: dict})
     def get(self, request):
         try:
-            def to_key_label(choices):
-                return [{"key": k, "label": v} for k, v in choices]
-            
-            sectors = Question.objects \
-            .values_list("sector", flat=True) \
-            .distinct()
-        
-            sectors = set(sectors)
-
-            sectors = [
-                {"label": sec, "value": sec}
-                for sec in sectors if sec
-            ]
-
-            return Response({
-                "registration_types": to_key_label(Organization.RegistrationType.choices),
-                "innovation_types":   to_key_label(Organization.InnovationType.choices),
-                "geo_scopes":         to_key_label(Organization.GeoScope.choices),
-                "focus_sectors":      sectors,
-                "stages":             to_key_label(Organization.OrgStage.choices),
-                "impact_focus":       to_key_label(Organization.ImpactFocus.choices),
-                "use_of_questionnaire": to_key_label(Organization.UseOfQuestionnaire.choices),
-                "states": INDIA_STATES,
-                "top_states_limit": 5
-            })
+            # pre-rendered JSON bytes: skips the renderer for this mostly static payload
+            body = cache.get_or_set(META_OPTIONS_BODY_KEY, _meta_options_body, FOCUS_SECTORS_TTL)
+            return HttpResponse(body, content_type="application/json")
         except Exception as e:
             return Response(
                 {"message": "We could not fetch the meta options right now. Please try again later.", "errors": str(e)},
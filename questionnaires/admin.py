@@ -3,8 +3,25 @@ from .models import Section, Question, QuestionDimension, AnswerOption, Branchin
 
 # Register your models here.
 
+# Question.__str__ reads section.code and the child models' __str__ read
+# question.code: join those in so list pages and FK dropdowns aren't N+1.
+
+
+class QuestionAdmin(admin.ModelAdmin):
+    list_select_related = ["section"]
+
+
+class QuestionChildAdmin(admin.ModelAdmin):
+    list_select_related = ["question"]
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "question":
+            kwargs["queryset"] = Question.objects.select_related("section")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
 admin.site.register(Section)
-admin.site.register(Question)
-admin.site.register(QuestionDimension)
-admin.site.register(AnswerOption)
-admin.site.register(BranchingCondition)
\ No newline at end of file
+admin.site.register(Question, QuestionAdmin)
+admin.site.register(QuestionDimension, QuestionChildAdmin)
+admin.site.register(AnswerOption, QuestionChildAdmin)
+admin.site.register(BranchingCondition, QuestionChildAdmin)
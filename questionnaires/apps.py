@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class QuestionnairesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'questionnaires'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,22 @@
+# questionnaires/cache.py
+from django.core.cache import cache
+
+# Section eligibility rules are admin-edited and read on every scoring pass;
+# questionnaires/signals.py drops the key when a rule or section changes.
+SECTION_RULES_KEY = "eligibility:section_rules"
+SECTION_RULES_TTL = 3600
+
+
+def invalidate_section_rules():
+    cache.delete(SECTION_RULES_KEY)
+
+
+# Codes referenced by branching conditions: answering one of these can change
+# which questions are visible. Read on every answer PATCH; the Question and
+# BranchingCondition signals drop the key.
+CONTROL_QCODES_KEY = "questionnaire:control_qcodes"
+CONTROL_QCODES_TTL = 3600
+
+
+def invalidate_control_qcodes():
+    cache.delete(CONTROL_QCODES_KEY)
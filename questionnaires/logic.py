@@ -1,11 +1,20 @@
 # questionnaire/logic.py
 from __future__ import annotations
+import hashlib
+import math
+import operator
+from bisect import bisect_right
+from functools import lru_cache
 from decimal import Decimal
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models.signals import pre_save, post_save
 from django.utils import timezone
 from dataclasses import dataclass
-from typing import Dict, Tuple, List, Optional, Any
-from questionnaires.models import Section, EligibilityRule, LoanEligibilityResult, LoanInstrument
+from typing import Callable, Dict, Tuple, List, Optional, Any
+import orjson
+from django.core.cache import cache
+from questionnaires.models import EligibilityRule, LoanEligibilityResult, LoanInstrument
+from questionnaires.cache import SECTION_RULES_KEY, SECTION_RULES_TTL
 
 Rule = Dict[str, Any]
 AnswersMap = Dict[str, Any]  # {"Q_CODE": {"value": "YES"} or {"values": [...]} or {"values": {"dim": 7}}}
@@ -26,74 +35,133 @@ def _get_answer_value(ans: Any):
             return ans["values"]
     return ans
 
-def _op_eval(left, op: str, right):
-    if op == "eq":   return left == right
-    if op == "ne":   return left != right
-    if op == "gt":   return left is not None and right is not None and left >  right
-    if op == "gte":  return left is not None and right is not None and left >= right
-    if op == "lt":   return left is not None and right is not None and left <  right
-    if op == "lte":  return left is not None and right is not None and left <= right
-    if op == "in":
-        if isinstance(right, (list, tuple, set)):
-            return left in right
-        return False
-    if op == "nin":
-        if isinstance(right, (list, tuple, set)):
-            return left not in right
-        return False
-    if op == "contains":
-        # supports multi-select sets/lists and dicts (for multi-slider dims)
-        if isinstance(left, dict):
-            # right could be a key or {key: value} (exact)
-            if isinstance(right, dict):
-                return all(k in left and left[k] == v for k, v in right.items())
-            return right in left
-        if isinstance(left, (list, set, tuple)):
-            return right in left
-        if isinstance(left, str) and isinstance(right, str):
-            return right in left
-        return False
+def normalize_answers(answers: AnswersMap) -> Dict[str, Any]:
+    """
+    Map each question code to the value rules compare against (see
+    _get_answer_value), once per evaluation pass instead of per rule visit.
+    MULTI_CHOICE lists become frozensets for in/contains convenience.
+    """
+    normalized = {}
+    for q_code, ans in answers.items():
+        left = _get_answer_value(ans)
+        if isinstance(left, list):
+            try:
+                left = frozenset(left)
+            except TypeError:
+                pass
+        normalized[q_code] = left
+    return normalized
+
+def _none_guarded(cmp):
+    return lambda left, right: left is not None and right is not None and cmp(left, right)
+
+def _contains(left, right):
+    # supports multi-select sets/lists and dicts (for multi-slider dims)
+    if isinstance(left, dict):
+        # right could be a key or {key: value} (exact)
+        if isinstance(right, dict):
+            return all(k in left and left[k] == v for k, v in right.items())
+        return right in left
+    if isinstance(left, (list, set, frozenset, tuple)):
+        return right in left
+    if isinstance(left, str) and isinstance(right, str):
+        return right in left
     return False
 
-def evaluate_rule(rule: Rule, answers: AnswersMap) -> bool:
-    """
-    Evaluate rule JSON against current answers.
+_OP_TABLE: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": _none_guarded(operator.gt),
+    "gte": _none_guarded(operator.ge),
+    "lt": _none_guarded(operator.lt),
+    "lte": _none_guarded(operator.le),
+    "contains": _contains,
+}
 
-    Supported primitives:
-      {"q": "IMP_Q1", "op": "eq", "val": "YES"}
-      {"q": "RISK_Q2", "op": "in", "val": ["A","B"]}
-      {"q": "RET_Q3",  "op": "gte", "val": 7}
-      {"q": "IMP_Q4",  "op": "contains", "val": {"reach": 5}}
+def _always_true(answers: AnswersMap) -> bool:
+    return True
 
-    Combinators:
-      {"all": [ ...rules... ]}
-      {"any": [ ...rules... ]}
-      {"not": { ...rule... }}
-    """
+def _always_false(answers: AnswersMap) -> bool:
+    return False
+
+def _compile(rule: Rule) -> Callable[[AnswersMap], bool]:
     if not rule:
-        return True
+        return _always_true
 
     # combinators
     if "all" in rule:
-        return all(evaluate_rule(r, answers) for r in rule["all"])
+        subs = tuple(_compile(r) for r in rule["all"])
+        return lambda answers: all(f(answers) for f in subs)
     if "any" in rule:
-        return any(evaluate_rule(r, answers) for r in rule["any"])
+        subs = tuple(_compile(r) for r in rule["any"])
+        return lambda answers: any(f(answers) for f in subs)
     if "not" in rule:
-        return not evaluate_rule(rule["not"], answers)
+        sub = _compile(rule["not"])
+        return lambda answers: not sub(answers)
 
     # primitive
     q_code = rule.get("q")
     op = rule.get("op")
     val = rule.get("val")
     if not q_code or not op:
-        return True  # be permissive
+        return _always_true  # be permissive
+
+    if op in ("in", "nin"):
+        if not isinstance(val, (list, tuple, set)):
+            return _always_false
+        try:
+            members = frozenset(val)
+        except TypeError:
+            members = val
+        negate = op == "nin"
+
+        def member(answers: AnswersMap) -> bool:
+            left = answers.get(q_code)
+            try:
+                hit = left in members
+            except TypeError:  # unhashable answer (e.g. a multi-choice set)
+                hit = left in val
+            return not hit if negate else hit
+        return member
+
+    op_fn = _OP_TABLE.get(op)
+    if op_fn is None:
+        return _always_false
+    return lambda answers: op_fn(answers.get(q_code), val)
+
+@lru_cache(maxsize=1024)
+def _compile_cached(key: bytes) -> Callable[[AnswersMap], bool]:
+    return _compile(orjson.loads(key))
+
+def compile_rule(rule: Rule) -> Callable[[AnswersMap], bool]:
+    """
+    Compile rule JSON (see evaluate_rule) into a predicate over a
+    normalize_answers() map. Compiled rules are cached by their canonical JSON,
+    so a condition stored on a question is parsed once per process rather than
+    on every evaluation.
+    """
+    try:
+        key = orjson.dumps(rule, option=orjson.OPT_SORT_KEYS)
+    except TypeError:  # not plain JSON; compile without caching
+        return _compile(rule)
+    return _compile_cached(key)
+
+def evaluate_rule(rule: Rule, answers: AnswersMap) -> bool:
+    """
+    Evaluate rule JSON against current answers.
 
-    raw = answers.get(q_code)
-    left = _get_answer_value(raw)
-    # normalize MULTI_CHOICE to set for in/contains convenience
-    if isinstance(left, list):
-        left = set(left)
-    return _op_eval(left, op, val)
+    Supported primitives:
+      {"q": "IMP_Q1", "op": "eq", "val": "YES"}
+      {"q": "RISK_Q2", "op": "in", "val": ["A","B"]}
+      {"q": "RET_Q3",  "op": "gte", "val": 7}
+      {"q": "IMP_Q4",  "op": "contains", "val": {"reach": 5}}
+
+    Combinators:
+      {"all": [ ...rules... ]}
+      {"any": [ ...rules... ]}
+      {"not": { ...rule... }}
+    """
+    return compile_rule(rule)(normalize_answers(answers))
 
 
 # Tunables
@@ -102,9 +170,27 @@ CLAMP_MIN = Decimal("0")
 CLAMP_MAX = Decimal("100")
 
 
+def _to_decimal(x: Decimal | float | int) -> Decimal:
+    # only floats (and odd types) need the str() round-trip to keep their short
+    # repr; Decimals (model DecimalFields) and ints convert exactly as they are
+    if type(x) is Decimal:
+        return x
+    if type(x) is int:
+        return Decimal(x)
+    return Decimal(str(x))
+
+
+@lru_cache(maxsize=256)
+def _clamp_int(x: int) -> Decimal:
+    # JSON section scores are mostly whole numbers; same Decimal back each time
+    return min(max(Decimal(x), CLAMP_MIN), CLAMP_MAX)
+
+
 def _clamp_0_100(x: Decimal | float | int) -> Decimal:
+    if type(x) is int:
+        return _clamp_int(x)
     try:
-        d = Decimal(str(x))
+        d = _to_decimal(x)
     except Exception:
         return Decimal("0")
     if d < CLAMP_MIN:
@@ -128,29 +214,45 @@ def _normalize_to_100(raw: Decimal | float | int) -> Decimal:
     Otherwise clamp.
     """
     try:
-        d = Decimal(str(raw))
+        d = _to_decimal(raw)
     except Exception:
         return Decimal("0")
 
-    if Decimal("0") <= d <= Decimal("1"):
-        return _clamp_0_100(d * Decimal("100"))
+    if CLAMP_MIN <= d <= 1:
+        return _clamp_0_100(d * CLAMP_MAX)
 
     # treat everything else as already-on-100 scale
     return _clamp_0_100(d)
 
 
-def _load_section_rules() -> Dict[str, EligibilityRule]:
+@dataclass(frozen=True, slots=True)
+class SectionRule:
+    """The EligibilityRule columns scoring reads, detached from the ORM."""
+    min_threshold: Decimal
+    max_threshold: Decimal
+    weight: Decimal
+    criteria: Dict[str, Any]
+    recommendation: Optional[str]
+
+
+def _query_section_rules() -> Dict[str, SectionRule]:
+    # in section order: eligibility_check walks the sections in this order
+    rows = EligibilityRule.objects.order_by("section__order", "section_id").values_list(
+        "section__code", "min_threshold", "max_threshold", "weight", "criteria", "recommendation",
+    )
+    return {code: SectionRule(*fields) for code, *fields in rows}
+
+
+def _load_section_rules() -> Dict[str, SectionRule]:
     """
-    Returns a mapping: section_code -> EligibilityRule
+    Returns a mapping: section_code -> SectionRule, ordered by Section.order.
     Only active sections that actually have a rule seeded will matter.
+    Served from the cache; rule/section saves invalidate it.
     """
-    rules: Dict[str, EligibilityRule] = {}
-    for r in EligibilityRule.objects.select_related("section").all():
-        rules[r.section.code] = r
-    return rules
+    return cache.get_or_set(SECTION_RULES_KEY, _query_section_rules, SECTION_RULES_TTL)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstrumentRule:
     name: str
     impact_range: Tuple[int, int]   # inclusive
@@ -329,6 +431,38 @@ INSTRUMENT_RULES: List[InstrumentRule] = [
 ]
 
 
+# The rules tile a fixed band grid (5 impact x 5 risk x 3 return), so the first
+# match for a score triple is a dict lookup on its band indices.
+_IMPACT_BANDS = tuple(sorted({r.impact_range for r in INSTRUMENT_RULES}))
+_RISK_BANDS = tuple(sorted({r.risk_range for r in INSTRUMENT_RULES}))
+_RETURN_BANDS = tuple(sorted({r.return_range for r in INSTRUMENT_RULES}))
+
+_INSTRUMENT_INDEX: Dict[Tuple[int, int, int], InstrumentRule] = {}
+for _rule in INSTRUMENT_RULES:
+    _INSTRUMENT_INDEX.setdefault(
+        (
+            _IMPACT_BANDS.index(_rule.impact_range),
+            _RISK_BANDS.index(_rule.risk_range),
+            _RETURN_BANDS.index(_rule.return_range),
+        ),
+        _rule,
+    )
+del _rule
+
+
+def _band_of(v: float, bands: Tuple[Tuple[int, int], ...]) -> Optional[int]:
+    """Index of the inclusive band containing v; None for gaps like 20 < v < 21."""
+    i = bisect_right(bands, (v, math.inf)) - 1
+    if i >= 0 and v <= bands[i][1]:
+        return i
+    return None
+
+
+def _match_instrument_rule(impact: float, risk: float, ret: float) -> Optional[InstrumentRule]:
+    key = (_band_of(impact, _IMPACT_BANDS), _band_of(risk, _RISK_BANDS), _band_of(ret, _RETURN_BANDS))
+    return _INSTRUMENT_INDEX.get(key)
+
+
 def _pick_instrument(
     overall_score: Decimal,
     details: Dict,
@@ -344,8 +478,6 @@ def _pick_instrument(
       IMPACT, RISK, RETURN
     - RISK here is LOWER = better (risk level), NOT inverted.
     """
-    from questionnaires.models import LoanInstrument  # local import to avoid cycles
-
     def get_norm(code: str) -> float:
         sec = (details.get("sections") or {}).get(code, {})
         try:
@@ -354,23 +486,7 @@ def _pick_instrument(
         except Exception:
             return 0.0
 
-    def in_range(v: float, lo: int, hi: int) -> bool:
-        return lo <= v <= hi
-
-    I = get_norm("IMPACT")
-    R = get_norm("RISK")
-    Ret = get_norm("RETURN")
-
-    matched: Optional[InstrumentRule] = None
-    for rule in INSTRUMENT_RULES:
-        if (
-            in_range(I, rule.impact_range[0], rule.impact_range[1])
-            and in_range(R, rule.risk_range[0], rule.risk_range[1])
-            and in_range(Ret, rule.return_range[0], rule.return_range[1])
-        ):
-            matched = rule
-            break
-
+    matched = _match_instrument_rule(get_norm("IMPACT"), get_norm("RISK"), get_norm("RETURN"))
     if not matched:
         return None
 
@@ -389,38 +505,34 @@ def _pick_instrument(
     return inst
 
 
-@transaction.atomic
-def eligibility_check(assessment, *, overall_threshold: Decimal = DEFAULT_OVERALL_PASS_THRESHOLD):
+def _eligibility_defaults(
+    assessment,
+    rules_by_code: Dict[str, SectionRule],
+    overall_threshold: Decimal,
+) -> Dict[str, Any]:
+    """Score one assessment against the section rules; returns the LoanEligibilityResult fields."""
     if not assessment.scores or "sections" not in assessment.scores:
-        obj, _ = LoanEligibilityResult.objects.update_or_create(
-            assessment=assessment,
-            defaults={
-                "overall_score": Decimal("0"),
-                "is_eligible": False,
-                "matched_instrument": None,
-                "details": {
-                    "reason": "Scores not available",
-                    "sections": {},
-                    "weights_sum": 0,
-                },
-                "evaluated_at": timezone.now(),
+        return {
+            "overall_score": Decimal("0"),
+            "is_eligible": False,
+            "matched_instrument": None,
+            "details": {
+                "reason": "Scores not available",
+                "sections": {},
+                "weights_sum": 0,
             },
-        )
-        return obj
+            "evaluated_at": timezone.now(),
+        }
 
     sec_scores = assessment.scores.get("sections", {}) or {}
-    rules_by_code = _load_section_rules()
 
     details = {"sections": {}, "weights_sum": 0}
     total_weighted = Decimal("0")
     weights_sum = Decimal("0")
     all_section_gates_pass = True
 
-    for section in Section.objects.all().order_by("order"):
-        code = section.code
-        if code not in rules_by_code:
-            continue
-
+    # only sections with a rule matter, and the rules map is already in section order
+    for code in rules_by_code:
         raw_score = sec_scores.get(code)
         if raw_score is None:
             # rule exists but score missing -> fail gate
@@ -433,16 +545,15 @@ def eligibility_check(assessment, *, overall_threshold: Decimal = DEFAULT_OVERAL
                 "weight": float(rules_by_code[code].weight or 0),
                 "contribution": 0.0,
                 "gate_pass": False,
-                "criteria": rules_by_code[code].criteria or {},
-                "recommendation": rules_by_code[code].recommendation or "",
             }
             continue
 
         rule = rules_by_code[code]
-        score_0_100 = _clamp_0_100(Decimal(str(raw_score)))  # already 0..100
-        w = Decimal(str(rule.weight or 0))
-        min_t = Decimal(str(rule.min_threshold))
-        max_t = Decimal(str(rule.max_threshold))
+        # already 0..100; non-numeric scores raise in _to_decimal
+        score_0_100 = _clamp_0_100(raw_score if type(raw_score) is int else _to_decimal(raw_score))
+        w = _to_decimal(rule.weight or 0)
+        min_t = _to_decimal(rule.min_threshold)
+        max_t = _to_decimal(rule.max_threshold)
 
         # Gate check on 0..100 for ALL sections (including RISK).
         # RISK lower-better is naturally enforced because max_t is low (e.g., 40).
@@ -462,8 +573,6 @@ def eligibility_check(assessment, *, overall_threshold: Decimal = DEFAULT_OVERAL
             "weight": float(w),
             "contribution": float(contrib),
             "gate_pass": gate_pass,
-            "criteria": rule.criteria or {},
-            "recommendation": rule.recommendation or "",
         }
 
         if not gate_pass:
@@ -490,14 +599,125 @@ def eligibility_check(assessment, *, overall_threshold: Decimal = DEFAULT_OVERAL
 
     instrument = _pick_instrument(overall_score, details, stage=stage_str)
 
-    obj, _ = LoanEligibilityResult.objects.update_or_create(
-        assessment=assessment,
-        defaults={
-            "overall_score": overall_score,
-            "is_eligible": is_eligible,
-            "matched_instrument": instrument,
-            "details": details,
-            "evaluated_at": timezone.now(),
-        },
+    return {
+        "overall_score": overall_score,
+        "is_eligible": is_eligible,
+        "matched_instrument": instrument,
+        "details": details,
+        "evaluated_at": timezone.now(),
+    }
+
+
+_RESULT_FIELDS = ["overall_score", "is_eligible", "matched_instrument", "details", "evaluated_at"]
+
+
+def _save_results(results: List[LoanEligibilityResult]) -> None:
+    """
+    Update the rows that already exist and create the rest, one statement each.
+    bulk_update/bulk_create send no model signals, so pre_save/post_save are sent
+    by hand: the admin audit log and the bank SPO list cache both hang off them.
+    """
+    using = LoanEligibilityResult.objects.db
+    existing = dict(
+        LoanEligibilityResult.objects.select_for_update()
+            .filter(assessment_id__in=[r.assessment_id for r in results])
+            .values_list("assessment_id", "pk")
+    )
+    to_update, to_create = [], []
+    for obj in results:
+        obj.pk = existing.get(obj.assessment_id)
+        if obj.pk is None:
+            to_create.append(obj)
+        else:
+            pre_save.send(sender=LoanEligibilityResult, instance=obj, raw=False, using=using, update_fields=_RESULT_FIELDS)
+            to_update.append(obj)
+
+    LoanEligibilityResult.objects.bulk_update(to_update, _RESULT_FIELDS, batch_size=500)
+    LoanEligibilityResult.objects.bulk_create(to_create, batch_size=500)
+
+    for obj in to_update:
+        post_save.send(
+            sender=LoanEligibilityResult, instance=obj, created=False,
+            update_fields=_RESULT_FIELDS, raw=False, using=using,
+        )
+    for obj in to_create:
+        post_save.send(
+            sender=LoanEligibilityResult, instance=obj, created=True,
+            update_fields=None, raw=False, using=using,
+        )
+
+
+def enrich_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Stored details leave out each rule's criteria/recommendation (they belong to
+    the rule, not the assessment); merge the current ones back in for display.
+    """
+    rules_by_code = _load_section_rules()
+    sections = {}
+    for code, sec in (details.get("sections") or {}).items():
+        rule = rules_by_code.get(code)
+        if rule is not None:
+            sec = {**sec, "criteria": rule.criteria or {}, "recommendation": rule.recommendation or ""}
+        sections[code] = sec
+    # scores_hash is bookkeeping for eligibility_check, not part of the result
+    enriched = {k: v for k, v in details.items() if k != "scores_hash"}
+    enriched["sections"] = sections
+    return enriched
+
+
+def _scores_hash(assessment, overall_threshold: Decimal, rules_by_code: Dict[str, SectionRule]) -> str:
+    """Fingerprint of everything a result depends on: scores, stage, threshold and the rules themselves."""
+    org_stage = getattr(getattr(assessment, "organization", None), "org_stage", None)
+    payload = orjson.dumps(
+        [assessment.scores, str(org_stage), str(overall_threshold), list(rules_by_code.items())],
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
     )
-    return obj
\ No newline at end of file
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+@transaction.atomic
+def eligibility_check(assessment, *, overall_threshold: Decimal = DEFAULT_OVERALL_PASS_THRESHOLD):
+    # rules are read from the DB here, not the per-process cache: a rule edit
+    # must change the hash (and the decision) on every worker straight away
+    rules_by_code = _query_section_rules()
+    scores_hash = _scores_hash(assessment, overall_threshold, rules_by_code)
+    # re-checks of an unchanged assessment (UI refreshes, retries) reuse the stored result
+    existing = LoanEligibilityResult.objects.select_for_update().filter(assessment=assessment).first()
+    if existing is not None and (existing.details or {}).get("scores_hash") == scores_hash:
+        return existing
+
+    defaults = _eligibility_defaults(assessment, rules_by_code, overall_threshold)
+    defaults["details"]["scores_hash"] = scores_hash
+    if existing is None:
+        try:
+            with transaction.atomic():
+                return LoanEligibilityResult.objects.create(assessment=assessment, **defaults)
+        except IntegrityError:
+            # a concurrent check created the row first
+            existing = LoanEligibilityResult.objects.select_for_update().get(assessment=assessment)
+
+    # the row is already loaded: one UPDATE, and save() keeps the audit/cache signals
+    for field, value in defaults.items():
+        setattr(existing, field, value)
+    existing.save(update_fields=_RESULT_FIELDS)
+    return existing
+
+
+@transaction.atomic
+def eligibility_check_bulk(assessments, *, overall_threshold: Decimal = DEFAULT_OVERALL_PASS_THRESHOLD):
+    """
+    Batch re-scoring: same result as eligibility_check per assessment, but the
+    rules are read once and the results are written with one update and one insert.
+    Pass assessments with select_related("organization").
+    Returns the LoanEligibilityResult rows in input order.
+    """
+    assessments = {a.pk: a for a in assessments}.values()
+    rules_by_code = _query_section_rules()
+    results = []
+    for a in assessments:
+        defaults = _eligibility_defaults(a, rules_by_code, overall_threshold)
+        defaults["details"]["scores_hash"] = _scores_hash(a, overall_threshold, rules_by_code)
+        results.append(LoanEligibilityResult(assessment=a, **defaults))
+    _save_results(results)
+    return results
@@ -1,10 +1,11 @@
 # questionnaires/management/commands/create_dummy_questions.py
 
 from django.core.management.base import BaseCommand
-from django.db.models import Max
+from django.db.models import Count
 from django.utils.text import slugify
 
 from questionnaires.models import Section, Question
+from organizations.cache import invalidate_focus_sectors
 
 
 class Command(BaseCommand):
@@ -33,9 +34,10 @@ class Command(BaseCommand):
         else:
             # Infer from existing questions' sector values
             self.stdout.write(self.style.WARNING("No sectors passed; inferring from existing Question.sector values."))
-            sector_list = (
+            sector_list = list(
                 Question.objects.exclude(sector__isnull=True)
                                 .exclude(sector="")
+                                .order_by()
                                 .values_list("sector", flat=True)
                                 .distinct()
             )
@@ -57,7 +59,18 @@ class Command(BaseCommand):
             )
             return
 
-        created_count = 0
+        # 3) Everything the loop needs to know, in two queries
+        existing_counts = {
+            (row["section_id"], row["sector"]): row["n"]
+            for row in Question.objects.filter(section__in=sections.values(), sector__in=sector_list)
+                                       .values("section_id", "sector")
+                                       .annotate(n=Count("id"))
+        }
+        existing_codes = set(
+            Question.objects.filter(code__startswith="DUMMY_").values_list("code", flat=True)
+        )
+
+        new_questions = []
 
         for sector in sector_list:
             self.stdout.write(f"Processing sector: {sector}")
@@ -66,44 +79,41 @@ class Command(BaseCommand):
                 section = sections[code]
 
                 # Check if there is already any question for this section+sector
-                existing_qs = Question.objects.filter(section=section, sector=sector)
-
-                if existing_qs.exists():
+                existing = existing_counts.get((section.id, sector), 0)
+                if existing:
                     # If you strictly want exactly ONE dummy only when NONE exists, skip:
-                    self.stdout.write(f"  - Section {code}: already has {existing_qs.count()} question(s), skipping.")
+                    self.stdout.write(f"  - Section {code}: already has {existing} question(s), skipping.")
                     continue
 
-                # Compute next order within this section+sector bucket
-                max_order = (
-                    Question.objects.filter(section=section, sector=sector)
-                    .aggregate(m=Max("order"))["m"]
-                    or 0
-                )
-                new_order = max_order + 1
-
                 # Generate a unique code
                 base_code = f"DUMMY_{code}_{slugify(sector).upper()}"
                 code_candidate = base_code
                 idx = 1
-                while Question.objects.filter(code=code_candidate).exists():
+                while code_candidate in existing_codes:
                     code_candidate = f"{base_code}_{idx}"
                     idx += 1
+                existing_codes.add(code_candidate)
 
-                q = Question.objects.create(
+                new_questions.append(Question(
                     section=section,
                     code=code_candidate,
                     text=f"Dummy {code} question for sector {sector}",
                     help_text="Auto generated dummy question for initial setup.",
                     type="SINGLE_CHOICE",  # <-- change if your type choices differ
                     required=False,
-                    order=new_order,
+                    # the section+sector bucket is empty, so this is its first question
+                    order=1,
                     max_score=0,
                     weight=1,
                     is_active=True,
                     sector=sector,
-                )
+                ))
+
+        Question.objects.bulk_create(new_questions, batch_size=500)
+        # bulk_create sends no post_save
+        invalidate_focus_sectors()
 
-                self.stdout.write(f"  + Created question {q.id} for section={code}, sector={sector}")
-                created_count += 1
+        for q in new_questions:
+            self.stdout.write(f"  + Created question {q.id} for section={q.section.code}, sector={q.sector}")
 
-        self.stdout.write(self.style.SUCCESS(f"Done. Created {created_count} dummy questions."))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS(f"Done. Created {len(new_questions)} dummy questions."))
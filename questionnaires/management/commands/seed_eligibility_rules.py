@@ -1,8 +1,11 @@
 from django.core.management.base import BaseCommand
 from pathlib import Path
-import json
+import orjson
+
+from django.db import transaction
 
 from questionnaires.models import Section, EligibilityRule
+from questionnaires.cache import invalidate_section_rules
 
 class Command(BaseCommand):
     help = "Seed EligibilityRule entries from JSON file"
@@ -14,30 +17,39 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR("File eligibility_rules.json not found in seed_data/"))
             return
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
+
+        fields = ["min_threshold", "max_threshold", "weight", "criteria", "recommendation"]
+        sections = {s.code: s for s in Section.objects.filter(code__in=[r["section_code"] for r in data])}
+        existing = {r.section_id: r for r in EligibilityRule.objects.filter(section__in=sections.values())}
 
-        created, updated = 0, 0
+        to_create, to_update = {}, {}
         for rule in data:
-            try:
-                section = Section.objects.get(code=rule["section_code"])
-            except Section.DoesNotExist:
+            section = sections.get(rule["section_code"])
+            if section is None:
                 self.stdout.write(self.style.WARNING(f"Section {rule['section_code']} not found. Skipping."))
                 continue
 
-            obj, created_flag = EligibilityRule.objects.update_or_create(
-                section=section,
-                defaults={
-                    "min_threshold": rule["min_threshold"],
-                    "max_threshold": rule["max_threshold"],
-                    "weight": rule["weight"],
-                    "criteria": rule.get("criteria", {}),
-                    "recommendation": rule.get("recommendation", "")
-                }
-            )
-            if created_flag:
-                created += 1
+            values = {
+                "min_threshold": rule["min_threshold"],
+                "max_threshold": rule["max_threshold"],
+                "weight": rule["weight"],
+                "criteria": rule.get("criteria", {}),
+                "recommendation": rule.get("recommendation", "")
+            }
+            obj = existing.get(section.id)
+            if obj is None:
+                to_create[section.id] = EligibilityRule(section=section, **values)
             else:
-                updated += 1
-
-        self.stdout.write(self.style.SUCCESS(f"Eligibility rules seeded: {created} created, {updated} updated"))
\ No newline at end of file
+                for field, value in values.items():
+                    setattr(obj, field, value)
+                to_update[section.id] = obj
+
+        with transaction.atomic():
+            EligibilityRule.objects.bulk_create(to_create.values())
+            EligibilityRule.objects.bulk_update(to_update.values(), fields)
+            # bulk writes send no post_save
+            transaction.on_commit(invalidate_section_rules)
+
+        created, updated = len(to_create), len(to_update)
+        self.stdout.write(self.style.SUCCESS(f"Eligibility rules seeded: {created} created, {updated} updated"))
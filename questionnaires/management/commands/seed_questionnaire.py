@@ -1,9 +1,17 @@
 # questionnaires/management/commands/seed_questionnaire.py
-import json
+from collections import defaultdict
+import orjson
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from questionnaires.models import Section, Question, AnswerOption, QuestionDimension, BranchingCondition
 from django.db import transaction
+from organizations.cache import invalidate_focus_sectors
+from questionnaires.cache import invalidate_control_qcodes, invalidate_section_rules
+
+
+def _canonical(logic) -> bytes:
+    return orjson.dumps(logic, option=orjson.OPT_SORT_KEYS)
+
 
 class Command(BaseCommand):
     help = "Seed Sections/Questions/Options/Dimensions/Conditions from a JSON file."
@@ -17,58 +25,94 @@ class Command(BaseCommand):
         if not path.exists():
             raise CommandError(f"File not found: {path}")
 
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
 
         sections = data.get("sections", [])
         self.stdout.write(self.style.NOTICE(f"Seeding {len(sections)} sections..."))
 
-        for s in sections:
-            sec, _ = Section.objects.update_or_create(
-                code=s["code"],
-                defaults={"title": s.get("title", s["code"]), "order": s.get("order", 0)},
-            )
+        # Sections and questions are upserted on their unique code: one
+        # INSERT ... ON CONFLICT DO UPDATE per table, pks come back on the objects
+        sec_objs = {
+            s["code"]: Section(code=s["code"], title=s.get("title", s["code"]), order=s.get("order", 0))
+            for s in sections
+        }
+        Section.objects.bulk_create(
+            sec_objs.values(), update_conflicts=True, unique_fields=["code"], update_fields=["title", "order"],
+        )
 
+        seeded = {}  # code -> (question row, question JSON); a repeated code keeps its last entry
+        for s in sections:
+            sec = sec_objs[s["code"]]
             for q in s.get("questions", []):
-                q_obj, _ = Question.objects.update_or_create(
+                q_obj = Question(
                     code=q["code"],
-                    defaults={
-                        "section": sec,
-                        "text": q["text"],
-                        "help_text": q.get("help_text"),
-                        "type": q["type"],
-                        "required": q.get("required", True),
-                        "order": q.get("order", 0),
-                        "max_score": q.get("max_score"),
-                        "weight": q.get("weight", 1.0),
-                    },
+                    section=sec,
+                    text=q["text"],
+                    help_text=q.get("help_text"),
+                    type=q["type"],
+                    required=q.get("required", True),
+                    order=q.get("order", 0),
+                    max_score=q.get("max_score"),
+                    weight=q.get("weight", 1.0),
                 )
+                seeded[q_obj.code] = (q_obj, q)
+
+        Question.objects.bulk_create(
+            [q_obj for q_obj, _ in seeded.values()],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["code"],
+            update_fields=["section", "text", "help_text", "type", "required", "order", "max_score", "weight"],
+        )
+        # bulk_create sends no post_save: drop what the Section/Question signals would have
+        transaction.on_commit(invalidate_section_rules)
+        transaction.on_commit(invalidate_focus_sectors)
+        transaction.on_commit(invalidate_control_qcodes)
+
+        # Options/dimensions are replaced wholesale: one DELETE and one batched
+        # INSERT per child table instead of a round-trip per row
+        q_objs = [q_obj for q_obj, _ in seeded.values()]
+        AnswerOption.objects.filter(question__in=q_objs).delete()
+        QuestionDimension.objects.filter(question__in=q_objs).delete()
+
+        # Conditions are diffed instead: rows whose logic is unchanged (compared
+        # as canonical JSON) are kept, only removed/new ones are written
+        stale_conds = defaultdict(list)  # (question_id, canonical logic) -> condition ids
+        for cond_id, question_id, logic in BranchingCondition.objects.filter(
+            question__in=q_objs
+        ).values_list("id", "question_id", "logic"):
+            stale_conds[(question_id, _canonical(logic))].append(cond_id)
+
+        opts, dims, conds = [], [], []
+        for q_obj, q in seeded.values():
+            for opt in q.get("options", []):
+                opts.append(AnswerOption(
+                    question=q_obj,
+                    label=opt["label"],
+                    value=opt["value"],
+                    points=opt.get("points", 0),
+                ))
+            for dim in q.get("dimensions", []):
+                dims.append(QuestionDimension(
+                    question=q_obj,
+                    code=dim["code"],
+                    label=dim.get("label", dim["code"]),
+                    min_value=dim.get("min", 0),
+                    max_value=dim.get("max", 10),
+                    points_per_unit=dim.get("points_per_unit", 1.0),
+                    weight=dim.get("weight", 1.0),
+                ))
+            for cond in q.get("conditions", []):
+                kept = stale_conds.get((q_obj.pk, _canonical(cond)))
+                if kept:
+                    kept.pop()  # an identical row is already stored
+                else:
+                    conds.append(BranchingCondition(question=q_obj, logic=cond))
+
+        BranchingCondition.objects.filter(id__in=[i for ids in stale_conds.values() for i in ids]).delete()
 
-                # Options (replace all)
-                AnswerOption.objects.filter(question=q_obj).delete()
-                for opt in q.get("options", []):
-                    AnswerOption.objects.create(
-                        question=q_obj,
-                        label=opt["label"],
-                        value=opt["value"],
-                        points=opt.get("points", 0),
-                    )
-
-                # Dimensions (replace all)
-                QuestionDimension.objects.filter(question=q_obj).delete()
-                for dim in q.get("dimensions", []):
-                    QuestionDimension.objects.create(
-                        question=q_obj,
-                        code=dim["code"],
-                        label=dim.get("label", dim["code"]),
-                        min_value=dim.get("min", 0),
-                        max_value=dim.get("max", 10),
-                        points_per_unit=dim.get("points_per_unit", 1.0),
-                        weight=dim.get("weight", 1.0),
-                    )
-
-                # Conditions (replace all)
-                BranchingCondition.objects.filter(question=q_obj).delete()
-                for cond in q.get("conditions", []):
-                    BranchingCondition.objects.create(question=q_obj, logic=cond)
+        AnswerOption.objects.bulk_create(opts, batch_size=1000)
+        QuestionDimension.objects.bulk_create(dims, batch_size=1000)
+        BranchingCondition.objects.bulk_create(conds, batch_size=1000)
 
         self.stdout.write(self.style.SUCCESS("Questionnaire seeding complete."))
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import annotations
 from decimal import Decimal
 from django.db import models
 from django.utils import timezone
+from config.encoders import ORJSONDecoder, ORJSONEncoder
 
 class Section(models.Model):
     code = models.CharField(max_length=50, unique=True)  # e.g. IMPACT, RISK
@@ -43,6 +44,18 @@ class Question(models.Model):
 
     class Meta:
         ordering = ["section", "order"]
+        indexes = [
+            # DISTINCT sector for the onboarding/meta sector lists
+            models.Index(
+                fields=["sector"],
+                name="q_sector_idx",
+                condition=models.Q(sector__isnull=False) & ~models.Q(sector=""),
+            ),
+            # section+sector question lists (ordered) and the builder's Max(order) lookup
+            models.Index(fields=["section", "sector", "order"], name="q_section_sector_order_idx"),
+            # default ordering
+            models.Index(fields=["section", "order"], name="q_section_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.section.code} - {self.code}"
@@ -74,7 +87,7 @@ class QuestionDimension(models.Model):
 
 class BranchingCondition(models.Model):
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name="conditions")
-    logic = models.JSONField(help_text="JSON rule to evaluate visibility")
+    logic = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder, help_text="JSON rule to evaluate visibility")
 
     def __str__(self):
         return f"Condition for {self.question.code}"
@@ -116,7 +129,7 @@ class EligibilityRule(models.Model):
     min_threshold = models.DecimalField(max_digits=5, decimal_places=2, help_text="Minimum required section score (0–100 scale)")
     max_threshold = models.DecimalField(max_digits=5, decimal_places=2, help_text="Maximum acceptable section score (0–100 scale)")
     weight = models.DecimalField(max_digits=5, decimal_places=2, default=0, help_text="Weight contribution (0–100)")
-    criteria = models.JSONField(default=dict, blank=True, help_text="Additional JSON-based criteria (like metrics or ranges)")
+    criteria = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder, help_text="Additional JSON-based criteria (like metrics or ranges)")
     recommendation = models.TextField(blank=True, null=True)
 
     def __str__(self):
@@ -151,7 +164,7 @@ class LoanEligibilityResult(models.Model):
     overall_score = models.DecimalField(max_digits=5, decimal_places=2, help_text="Weighted overall score out of 100")
     is_eligible = models.BooleanField(default=False)
     matched_instrument = models.ForeignKey(LoanInstrument, on_delete=models.SET_NULL, null=True, blank=True)
-    details = models.JSONField(default=dict, blank=True, help_text="Per-section evaluation breakdown")
+    details = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder, help_text="Per-section evaluation breakdown")
     evaluated_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -187,7 +200,7 @@ class LoanRequest(models.Model):
     # snapshot: what we decided at submission time
     eligibility_overall  = models.DecimalField(max_digits=6, decimal_places=2, default=Decimal("0"))
     eligibility_decision = models.BooleanField(default=False)  # True only if check passed at submit time
-    eligibility_details  = models.JSONField(default=dict, blank=True)
+    eligibility_details  = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder)
 
     status       = models.CharField(max_length=20, choices=Status.choices, default=Status.DRAFT)
     submitted_at = models.DateTimeField(null=True, blank=True)
@@ -196,6 +209,11 @@ class LoanRequest(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["assessment", "-id"]),             # latest request per assessment
+            models.Index(fields=["organization", "-submitted_at"]),  # latest submission per organization
+            models.Index(fields=["organization", "-created_at"]),    # SPO's own requests, default ordering
+        ]
 
 class LoanStatusHistory(models.Model):
     request   = models.ForeignKey(LoanRequest, on_delete=models.CASCADE, related_name="history")
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from questionnaires.models import LoanRequest, FundType
 from assessments.models import Assessment
+from questionnaires.utils import user_owns_org
 
 class LoanMetaSerializer(serializers.Serializer):
     fund_types = serializers.ListField(child=serializers.DictField())
@@ -25,7 +26,7 @@ class LoanRequestCreateSerializer(serializers.ModelSerializer):
         user = request.user
 
         # SPO can only create for own org & latest assessment
-        if assessment.organization.created_by_id != user.id and assessment.organization not in user.organizations.all():
+        if not user_owns_org(user, assessment.organization):
             raise serializers.ValidationError("Not allowed for this organization/assessment.")
 
         # Ensure assessment is SUBMITTED and has scores
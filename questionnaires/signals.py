@@ -0,0 +1,18 @@
+# questionnaires/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from questionnaires.models import BranchingCondition, EligibilityRule, Question, Section
+from questionnaires.cache import invalidate_control_qcodes, invalidate_section_rules
+
+
+@receiver([post_save, post_delete], sender=EligibilityRule)
+@receiver([post_save, post_delete], sender=Section)
+def invalidate_cached_section_rules(sender, instance, **kwargs):
+    invalidate_section_rules()
+
+
+@receiver([post_save, post_delete], sender=BranchingCondition)
+@receiver([post_save, post_delete], sender=Question)
+def invalidate_cached_control_qcodes(sender, instance, **kwargs):
+    invalidate_control_qcodes()
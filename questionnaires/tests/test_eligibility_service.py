@@ -128,4 +128,162 @@ def test_eligibility_handles_missing_scores_or_rules():
     a = Assessment.objects.create(organization=org, status="SUBMITTED", submitted_at=timezone.now(), scores={})
     res = eligibility_check(a)
     assert res.is_eligible is False
-    assert res.details.get("reason") in {"Scores not available", "No applicable rules or weights defined."}
\ No newline at end of file
+    assert res.details.get("reason") in {"Scores not available", "No applicable rules or weights defined."}
+
+
+def test_instrument_index_matches_linear_scan():
+    from questionnaires.logic import INSTRUMENT_RULES, _match_instrument_rule
+
+    def scan(i, r, ret):
+        for rule in INSTRUMENT_RULES:
+            if (rule.impact_range[0] <= i <= rule.impact_range[1]
+                    and rule.risk_range[0] <= r <= rule.risk_range[1]
+                    and rule.return_range[0] <= ret <= rule.return_range[1]):
+                return rule
+        return None
+
+    # band edges, the gaps between bands and out-of-range values
+    points = [-1, 0, 10, 20, 20.5, 21, 33, 33.5, 34, 40, 50, 66, 66.5, 67, 80, 80.5, 81, 100, 100.5]
+    for i in points:
+        for r in points:
+            for ret in points:
+                assert _match_instrument_rule(i, r, ret) is scan(i, r, ret)
+
+
+def test_compiled_rules_are_reused_and_evaluate_like_rule_json():
+    from questionnaires.logic import compile_rule, evaluate_rule
+
+    rule = {"all": [
+        {"q": "Q1", "op": "in", "val": ["A", "B"]},
+        {"not": {"q": "Q2", "op": "contains", "val": "x"}},
+    ]}
+    assert compile_rule(rule) is compile_rule({**rule})
+    assert evaluate_rule(rule, {"Q1": {"value": "A"}, "Q2": {"values": ["y"]}}) is True
+    assert evaluate_rule(rule, {"Q1": {"value": "A"}, "Q2": {"values": ["x"]}}) is False
+    # an unhashable multi-choice answer still falls back to list membership
+    assert evaluate_rule({"q": "Q1", "op": "nin", "val": ["A"]}, {"Q1": {"values": ["A"]}}) is True
+
+
+@pytest.mark.django_db
+def test_bulk_eligibility_matches_single_check(seed_sections_and_rules):
+    from questionnaires.logic import eligibility_check_bulk
+
+    u = User.objects.create_user(email="user@x.com", password="Pass123!", role=User.Role.SPO)
+    org = Organization.objects.create(
+        name="Org E",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=u,
+    )
+    scores = [
+        {"sections": {"IMPACT": 100, "RISK": 20, "RETURN": 100}},
+        {"sections": {"IMPACT": 95, "RISK": 65, "RETURN": 95}},
+        {},
+    ]
+    assessments = [
+        Assessment.objects.create(organization=org, status="SUBMITTED", submitted_at=timezone.now(), scores=s)
+        for s in scores
+    ]
+    expected = [eligibility_check(a) for a in assessments]
+    LoanEligibilityResult.objects.filter(pk=expected[0].pk).delete()  # one insert, two updates
+
+    results = eligibility_check_bulk(assessments)
+    assert LoanEligibilityResult.objects.count() == 3
+    assert results[1].pk == expected[1].pk  # re-scoring updates the row in place
+    for want, got in zip(expected, results):
+        got.refresh_from_db()
+        assert (got.overall_score, got.is_eligible, got.matched_instrument_id, got.details) == (
+            want.overall_score, want.is_eligible, want.matched_instrument_id, want.details,
+        )
+
+
+@pytest.mark.django_db
+def test_unchanged_assessment_reuses_stored_result(seed_sections_and_rules):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    u = User.objects.create_user(email="user@x.com", password="Pass123!", role=User.Role.SPO)
+    org = Organization.objects.create(
+        name="Org F",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=u,
+    )
+    a = Assessment.objects.create(
+        organization=org,
+        status="SUBMITTED",
+        submitted_at=timezone.now(),
+        scores={"sections": {"IMPACT": 100, "RISK": 20, "RETURN": 100}},
+    )
+    first = eligibility_check(a)
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = eligibility_check(a)
+    assert not [q for q in ctx.captured_queries if q["sql"].startswith(("INSERT", "UPDATE"))]
+    assert again.evaluated_at == first.evaluated_at
+
+    # a rule change retires the stored result, even one that bypasses the signals
+    EligibilityRule.objects.filter(section__code="IMPACT").update(min_threshold=Decimal("99"))
+    assert eligibility_check(a).evaluated_at > first.evaluated_at
+
+
+@pytest.mark.django_db
+def test_rule_text_is_merged_in_at_read_time(seed_sections_and_rules):
+    from questionnaires.logic import enrich_details
+
+    u = User.objects.create_user(email="user@x.com", password="Pass123!", role=User.Role.SPO)
+    org = Organization.objects.create(
+        name="Org G",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=u,
+    )
+    a = Assessment.objects.create(
+        organization=org,
+        status="SUBMITTED",
+        submitted_at=timezone.now(),
+        scores={"sections": {"IMPACT": 100, "RISK": 20}},
+    )
+    res = eligibility_check(a)
+    assert "criteria" not in res.details["sections"]["IMPACT"]
+
+    assert "scores_hash" in res.details
+    assert "scores_hash" not in enrich_details(res.details)
+
+    shown = enrich_details(res.details)["sections"]
+    assert shown["IMPACT"]["criteria"] == {"note": "impact must be solid"}
+    assert shown["RETURN"]["recommendation"] == "Good"  # missing score, rule still described
+    assert shown["RISK"]["gate_pass"] is True
+
+
+@pytest.mark.django_db
+@pytest.mark.audit_signals
+def test_result_writes_reach_the_audit_log(seed_sections_and_rules):
+    from admin_portal.models import ActivityLog
+    from questionnaires.logic import eligibility_check_bulk
+
+    u = User.objects.create_user(email="user@x.com", password="Pass123!", role=User.Role.SPO)
+    org = Organization.objects.create(
+        name="Org H",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=u,
+    )
+    a = Assessment.objects.create(
+        organization=org,
+        status="SUBMITTED",
+        submitted_at=timezone.now(),
+        scores={"sections": {"IMPACT": 100, "RISK": 20, "RETURN": 100}},
+    )
+    b = Assessment.objects.create(organization=org, status="SUBMITTED", submitted_at=timezone.now(), scores={})
+
+    def logged(action):
+        return ActivityLog.objects.filter(model="loaneligibilityresult", action=action).count()
+
+    eligibility_check(a)
+    assert logged(ActivityLog.Action.CREATE) == 1
+
+    a.scores = {"sections": {"IMPACT": 10, "RISK": 20, "RETURN": 100}}
+    eligibility_check(a)
+    assert logged(ActivityLog.Action.UPDATE) == 1
+
+    a.scores = {"sections": {"IMPACT": 100, "RISK": 20, "RETURN": 100}}
+    eligibility_check_bulk([a, b])
+    assert logged(ActivityLog.Action.CREATE) == 2
+    assert logged(ActivityLog.Action.UPDATE) == 2
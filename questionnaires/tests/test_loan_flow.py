@@ -2,6 +2,7 @@
 import pytest
 from django.utils import timezone
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from accounts.models import User
 from organizations.models import Organization
@@ -22,8 +23,8 @@ def seed_sections_and_rules(db):
 def auth_client(email="spo@x.com", password="Pass123!", role="SPO"):
     user = User.objects.create_user(email=email, password=password, role=role)
     c = APIClient()
-    tok = c.post("/api/auth/login/", {"email": email, "password": password}, format="json").data["access"]
-    c.credentials(HTTP_AUTHORIZATION=f"Bearer {tok}")
+    # mint the token directly; the login endpoint has its own tests
+    c.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
     return user, c
 
 
@@ -91,4 +92,24 @@ def test_check_eligibility_then_submit(seed_sections_and_rules):
     assert data["assessment"] == a.id
     assert data["organization"] == org.id
     assert data["eligibility_decision"] is True
-    assert data["status"] == "SUBMITTED"
\ No newline at end of file
+    assert data["status"] == "SUBMITTED"
+
+
+@pytest.mark.django_db
+def test_other_spo_is_forbidden(seed_sections_and_rules):
+    owner, _ = auth_client(email="owner@x.com")
+    org = Organization.objects.create(
+        name="Org C",
+        registration_type=Organization.RegistrationType.PRIVATE_LTD,
+        created_by=owner,
+    )
+    a = Assessment.objects.create(
+        organization=org,
+        status="SUBMITTED",
+        submitted_at=timezone.now(),
+        scores={"sections": {"IMPACT": 100, "RISK": 10, "RETURN": 95}, "overall": 0},
+    )
+
+    _, other = auth_client(email="other@x.com")
+    assert other.get(f"/api/loan/prefill/?assessment_id={a.id}").status_code == 403
+    assert other.get(f"/api/loan/eligibility/?assessment_id={a.id}").status_code == 403
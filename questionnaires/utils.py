@@ -1,16 +1,22 @@
+def user_owns_org(user, org) -> bool:
+    # an SPO owns exactly one organization (Organization.created_by is one-to-one)
+    return org.created_by_id == user.id
+
 def extract_q_refs(rule) -> set:
-    if not rule:
-        return set()
+    # iterative walk into one accumulator (no per-level sets or recursion)
     refs = set()
-    if isinstance(rule, dict):
-        if "q" in rule:
-            refs.add(rule["q"])
+    stack = [rule]
+    while stack:
+        r = stack.pop()
+        if not r or not isinstance(r, dict):
+            continue
+        if "q" in r:
+            refs.add(r["q"])
         for k in ("all", "any"):
-            if k in rule and isinstance(rule[k], list):
-                for r in rule[k]:
-                    refs |= extract_q_refs(r)
-        if "not" in rule:
-            refs |= extract_q_refs(rule["not"])
+            if isinstance(r.get(k), list):
+                stack.extend(r[k])
+        if "not" in r:
+            stack.append(r["not"])
     return refs
 
 def _build_validation_message(exc_detail):
@@ -23,20 +29,14 @@ def _build_validation_message(exc_detail):
 
     # If it's already a string / list, just append
     if isinstance(detail, list):
-        extra = " ".join(str(m) for m in detail)
-        return f"{base} {extra}"
+        return f"{base} {' '.join(map(str, detail))}"
     if not isinstance(detail, dict):
         return f"{base} {detail}"
 
     # dict case: {"field": ["msg1", "msg2"], "non_field_errors": [...]}
-    parts = []
-    for field, messages in detail.items():
-        label = "General" if field == "non_field_errors" else field
-        if isinstance(messages, (list, tuple)):
-            msg_text = " ".join(str(m) for m in messages)
-        else:
-            msg_text = str(messages)
-        parts.append(f"{label}: {msg_text}")
-
-    extra = " ".join(parts)
-    return f"{base} {extra}" if extra else base
\ No newline at end of file
+    parts = [
+        f"{'General' if field == 'non_field_errors' else field}: "
+        + " ".join(map(str, messages if isinstance(messages, (list, tuple)) else (messages,)))
+        for field, messages in detail.items()
+    ]
+    return " ".join([base, *parts])
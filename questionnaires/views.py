@@ -10,14 +10,33 @@ from drf_spectacular.utils import (
 
 from assessments.models import Assessment
 from organizations.models import Organization
-from questionnaires.logic import eligibility_check
+from questionnaires.logic import eligibility_check, enrich_details
 from questionnaires.models import LoanRequest
+from questionnaires.utils import user_owns_org
 from questionnaires.serializers import (
     LoanMetaSerializer, LoanPrefillSerializer,
     LoanRequestCreateSerializer, LoanRequestDetailSerializer,
     fund_types_meta
 )
 
+# FundType is a fixed enum: build the meta payload once at import
+LOAN_META = {"fund_types": fund_types_meta()}
+
+def _load_owned_assessment(request):
+    """(assessment, None) for ?assessment_id= the SPO owns, else (None, error response)."""
+    aid = request.query_params.get("assessment_id")
+    if not aid:
+        return None, Response({"message": "assessment_id is required", "errors": {}}, status=400)
+
+    try:
+        a = Assessment.objects.select_related("organization").get(id=aid)
+    except Assessment.DoesNotExist:
+        return None, Response({"message": "Assessment not found", "errors": {}}, status=404)
+
+    if not user_owns_org(request.user, a.organization):
+        return None, Response({"message": "Not allowed", "errors": {}}, status=403)
+    return a, None
+
 class IsSPO(permissions.BasePermission):
     def has_permission(self, request, view):
         u = getattr(request, "user", None)
@@ -73,7 +92,7 @@ class LoanRequestViewSet(
     @action(detail=False, methods=["get"], url_path="meta")
     def meta(self, request, *args, **kwargs):
         try:
-            return Response({"fund_types": fund_types_meta()}, status=200)
+            return Response(LOAN_META, status=200)
         except Exception as e:
             return Response(
                 {"message": "We could not fetch the loan meta right now. Please try again later.", "errors": str(e)},
@@ -122,18 +141,9 @@ class LoanRequestViewSet(
     @action(detail=False, methods=["get"], url_path="prefill")
     def prefill(self, request, *args, **kwargs):
         try:
-            aid = request.query_params.get("assessment_id")
-            if not aid:
-                return Response({"message": "assessment_id is required", "errors": {}}, status=400)
-
-            try:
-                a = Assessment.objects.select_related("organization").get(id=aid)
-            except Assessment.DoesNotExist:
-                return Response({"message": "Assessment not found", "errors": {}}, status=404)
-
-            # ownership check
-            if a.organization.created_by_id != request.user.id and a.organization not in request.user.organizations.all():
-                return Response({"message": "Not allowed", "errors": {}}, status=403)
+            a, error = _load_owned_assessment(request)
+            if error is not None:
+                return error
 
             org: Organization = a.organization
             org_snapshot = {
@@ -211,24 +221,16 @@ class LoanRequestViewSet(
     @action(detail=False, methods=["get"], url_path="eligibility")
     def eligibility(self, request, *args, **kwargs):
         try:
-            aid = request.query_params.get("assessment_id")
-            if not aid:
-                return Response({"message": "assessment_id is required", "errors": {}}, status=400)
-
-            try:
-                a = Assessment.objects.select_related("organization").get(id=aid)
-            except Assessment.DoesNotExist:
-                return Response({"message": "Assessment not found", "errors": {}}, status=404)
-
-            if a.organization.created_by_id != request.user.id and a.organization not in request.user.organizations.all():
-                return Response({"message": "Not allowed", "errors": {}}, status=403)
+            a, error = _load_owned_assessment(request)
+            if error is not None:
+                return error
 
             res = eligibility_check(a)
             return Response({
                 "assessment_id": a.id,
                 "is_eligible": res.is_eligible,
                 "overall_score": float(res.overall_score),
-                "details": res.details,
+                "details": enrich_details(res.details),
             }, status=200)
         except Exception as e:
             return Response(
@@ -273,7 +275,7 @@ class LoanRequestViewSet(
             a: Assessment = ser.validated_data["assessment"]
 
             # ownership check mirrors read endpoints
-            if a.organization.created_by_id != request.user.id and a.organization not in request.user.organizations.all():
+            if not user_owns_org(request.user, a.organization):
                 return Response({"message": "Not allowed", "errors": {}}, status=403)
 
             elig = eligibility_check(a)
@@ -290,7 +292,7 @@ class LoanRequestViewSet(
                 fund_type=ser.validated_data["fund_type"],
                 eligibility_overall=elig.overall_score,
                 eligibility_decision=elig.is_eligible,
-                eligibility_details=elig.details,
+                eligibility_details=enrich_details(elig.details),  # snapshot keeps the rule text
                 status=LoanRequest.Status.SUBMITTED,
                 submitted_at=timezone.now(),
             )